@@ -1,136 +1,197 @@
-import cv2
-import mediapipe as mp
+import argparse
+import json
+import platform
+import sys
 import time
-import numpy as np
 
-# Konfigurasi (Sama seperti game.py)
-SCREEN_WIDTH = 1280
-SCREEN_HEIGHT = 720
-MOUTH_OPEN_THRESHOLD = 0.05
-TRACKING_X_MIN = 0.2
-TRACKING_X_MAX = 0.8
-TRACKING_Y_MIN = 0.2
-TRACKING_Y_MAX = 0.8
+import cv2
+import numpy as np
 
-def run_benchmark():
-    print("==========================================")
-    print("  BENCHMARK KINERJA: COMPUTER VISION (CV)")
-    print("==========================================")
-    print("Inisialisasi Mediapipe...")
-
-    mp_face_mesh = mp.solutions.face_mesh
-    face_mesh = mp_face_mesh.FaceMesh(
-        max_num_faces=1,
-        refine_landmarks=True,
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5
-    )
-
-    cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
-        print("ERROR: Kamera tidak ditemukan.")
-        return
-
-    print("\n[INSTRUKSI PENGUJIAN]")
-    print("1. Pastikan wajah Anda terlihat jelas di kamera.")
-    print("2. Benchmark akan berjalan selama 300 Frames (kurang lebih 10-15 detik).")
-    print("3. Cobalah gerakkan kepala dan buka mulut seperti saat bermain.")
-    print("Tekan ENTER untuk memulai...")
-    input()
-
-    print("Mulai mengukur...")
-
-    frame_count = 0
-    max_frames = 300
-    
-    latencies = []
-    detection_counts = 0
-    
-    start_time_total = time.time()
-
-    while frame_count < max_frames:
-        iter_start = time.time()
-
-        success, image = cap.read()
+from src.sources import open_source
+from src.vision import FaceTracker, CameraPreview, landmarks_to_result
+
+# Urutan stage pipeline CV (sama seperti worker di game.py)
+STAGES = ['capture', 'flip', 'color_convert', 'inference', 'landmark_math', 'preview_convert']
+
+# Stage dengan p95 di bawah nilai ini (ms) tidak dicek regresinya (noise timer)
+MIN_REGRESSION_DELTA_MS = 0.5
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark pipeline computer vision (headless, tanpa input interaktif)")
+    parser.add_argument('--source', default='synthetic',
+                        help="Input: video:<file>, frames:<dir>, camera[:index] atau synthetic (default: synthetic)")
+    parser.add_argument('--frames', type=int, default=300, help="Jumlah frame yang diukur (default: 300)")
+    parser.add_argument('--warmup', type=int, default=10, help="Frame pemanasan yang tidak dihitung (default: 10)")
+    parser.add_argument('--output', help="Tulis hasil JSON ke file ini")
+    parser.add_argument('--baseline', help="Bandingkan dengan hasil JSON sebelumnya")
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help="Batas kenaikan p95 relatif terhadap baseline sebelum dianggap regresi (default: 0.15)")
+    return parser.parse_args(argv)
+
+
+def summarize(samples):
+    values = np.asarray(samples, dtype=np.float64)
+    return {
+        'mean': float(np.mean(values)),
+        'p50': float(np.percentile(values, 50)),
+        'p95': float(np.percentile(values, 95)),
+        'p99': float(np.percentile(values, 99)),
+        'max': float(np.max(values)),
+        'jitter': float(np.std(values)),
+    }
+
+
+def run_benchmark(source, frames, warmup):
+    """Jalankan pipeline per stage dan kumpulkan latency (ms) tiap stage"""
+    synthetic = getattr(source, 'provides_landmarks', False)
+    # Full-frame tiap iterasi supaya angka inference bisa dibandingkan antar run
+    tracker = None if synthetic else FaceTracker(roi_enabled=False)
+    preview = CameraPreview(visible=True)
+
+    timings = {stage: [] for stage in STAGES}
+    total = []
+    detections = 0
+    measured = 0
+    start_total = None
+
+    while measured < frames:
+        t0 = time.perf_counter()
+        success, image = source.read()
         if not success:
-            continue
-
-        # Pre-processing
+            break
+        t1 = time.perf_counter()
         image = cv2.flip(image, 1)
+        t2 = time.perf_counter()
         image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        t3 = time.perf_counter()
+
+        if synthetic:
+            landmarks = source.points
+        else:
+            results = tracker.face_mesh.process(image_rgb)
+            landmarks = results.multi_face_landmarks[0].landmark if results.multi_face_landmarks else None
+        t4 = time.perf_counter()
+
+        result = None
+        if landmarks is not None:
+            points = landmarks if synthetic else np.array([(lm.x, lm.y) for lm in landmarks], dtype=np.float32)
+            result = landmarks_to_result(points, t1)
+        t5 = time.perf_counter()
+        preview.convert(image)
+        t6 = time.perf_counter()
+
+        if warmup > 0:
+            warmup -= 1
+            continue
+        if start_total is None:
+            start_total = t0
+
+        for stage, (begin, end) in zip(STAGES, [(t0, t1), (t1, t2), (t2, t3), (t3, t4), (t4, t5), (t5, t6)]):
+            timings[stage].append((end - begin) * 1000)
+        total.append((t6 - t0) * 1000)
+        detections += result is not None
+        measured += 1
+
+    if tracker is not None:
+        tracker.close()
+    if not measured:
+        return None
+
+    duration = time.perf_counter() - start_total
+    return {
+        'frames': measured,
+        'duration_s': duration,
+        'fps': measured / duration,
+        'detection_rate': detections / measured,
+        'stages': {stage: summarize(values) for stage, values in timings.items()},
+        'total': summarize(total),
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """Return daftar regresi: p95 stage naik lebih dari `tolerance` dibanding baseline"""
+    regressions = []
+    current = dict(report['stages'], total=report['total'])
+    previous = dict(baseline.get('stages', {}), total=baseline.get('total', {}))
+    for stage, stats in current.items():
+        base = previous.get(stage)
+        if not base or 'p95' not in base:
+            continue
+        delta = stats['p95'] - base['p95']
+        if delta > MIN_REGRESSION_DELTA_MS and stats['p95'] > base['p95'] * (1 + tolerance):
+            regressions.append({'stage': stage, 'baseline_p95': base['p95'], 'p95': stats['p95'],
+                                'change': delta / base['p95'] if base['p95'] else float('inf')})
+    return regressions
+
 
-        # 2. Inference Latency (Waktu proses AI)
-        inference_start = time.time()
-        results = face_mesh.process(image_rgb)
-        inference_end = time.time()
-
-        # 3. Post-processing Latency (Logika Game)
-        if results.multi_face_landmarks:
-            detection_counts += 1
-            face_landmarks = results.multi_face_landmarks[0].landmark
-            
-            # Logika hitung koordinat (sama seperti game.py)
-            nose_tip = face_landmarks[1]
-            percent_x = (nose_tip.x - TRACKING_X_MIN) / (TRACKING_X_MAX - TRACKING_X_MIN)
-            percent_y = (nose_tip.y - TRACKING_Y_MIN) / (TRACKING_Y_MAX - TRACKING_Y_MIN)
-            
-            # Logika deteksi mulut
-            lip_top = face_landmarks[13]
-            lip_bottom = face_landmarks[14]
-            lip_distance = abs(lip_top.y - lip_bottom.y)
-            is_eating = lip_distance > MOUTH_OPEN_THRESHOLD
-
-        iter_end = time.time()
-        
-        # Hitung latensi (Hanya proses inferensi + logic, tidak termasuk waktu tunggu kamera/IO)
-        # Ini merepresentasikan overhead CPU akibat AI
-        frame_latency = (iter_end - inference_start) * 1000 # ms
-        latencies.append(frame_latency)
-        
-        frame_count += 1
-        
-        # Feedback visual minimal
-        if frame_count % 50 == 0:
-            print(f"Progress: {frame_count}/{max_frames} frames...")
-
-    end_time_total = time.time()
-    total_duration = end_time_total - start_time_total
-
-    cap.release()
-    
-    # Analisis Data
-    avg_latency = np.mean(latencies)
-    min_latency = np.min(latencies)
-    max_latency = np.max(latencies)
-    std_dev_latency = np.std(latencies) # Jitter
-    actual_fps = frame_count / total_duration
-    accuracy_rate = (detection_counts / frame_count) * 100
-
-    print("\n==========================================")
+def print_report(report, regressions):
+    print("==========================================")
     print("  HASIL PENGUJIAN")
     print("==========================================")
-    print(f"Total Frames Diproses : {frame_count}")
-    print(f"Total Durasi Waktu    : {total_duration:.2f} detik")
+    print(f"Source                : {report['source']}")
+    print(f"Total Frames Diproses : {report['frames']}")
+    print(f"Total Durasi Waktu    : {report['duration_s']:.2f} detik")
+    print(f"Throughput            : {report['fps']:.2f} FPS")
+    print(f"Face Detection Rate   : {report['detection_rate'] * 100:.2f}%")
     print("------------------------------------------")
-    print(f"1. LATENCY (Processing Time per Frame):")
-    print(f"   - Rata-rata        : {avg_latency:.2f} ms")
-    print(f"   - Terbaik (Min)    : {min_latency:.2f} ms")
-    print(f"   - Terburuk (Max)   : {max_latency:.2f} ms")
-    print(f"   - Jitter (Stabil?) : {std_dev_latency:.2f} ms (Semakin kecil semakin baik)")
-    print("------------------------------------------")
-    print(f"2. THROUGHPUT:")
-    print(f"   - Real-time FPS    : {actual_fps:.2f} FPS")
-    print("------------------------------------------")
-    print(f"3. ACCURACY (Face Detection Rate):")
-    print(f"   - Terdeteksi       : {accuracy_rate:.2f}%")
-    print("   (Jika di bawah 90%, cek pencahayaan ruangan)")
+    print(f"{'stage (ms)':<16}{'p50':>8}{'p95':>8}{'p99':>8}{'jitter':>8}")
+    for stage, stats in list(report['stages'].items()) + [('total', report['total'])]:
+        print(f"{stage:<16}{stats['p50']:>8.2f}{stats['p95']:>8.2f}{stats['p99']:>8.2f}{stats['jitter']:>8.2f}")
+    if regressions is not None:
+        print("------------------------------------------")
+        if regressions:
+            for reg in regressions:
+                print(f"REGRESI {reg['stage']}: p95 {reg['baseline_p95']:.2f} -> {reg['p95']:.2f} ms "
+                      f"(+{reg['change'] * 100:.0f}%)")
+        else:
+            print("Tidak ada regresi dibanding baseline.")
     print("==========================================")
 
+
+def main(argv=None):
+    args = parse_args(argv)
+    source = open_source(args.source, realtime=False)
+    if not source.isOpened():
+        print(f"ERROR: Input source '{args.source}' tidak bisa dibuka.")
+        return 2
+
+    try:
+        report = run_benchmark(source, args.frames, args.warmup)
+    finally:
+        source.release()
+    if report is None:
+        print("ERROR: Tidak ada frame yang bisa diproses.")
+        return 2
+
+    report.update({
+        'source': args.source,
+        'python': platform.python_version(),
+        'opencv': cv2.__version__,
+        'machine': platform.machine(),
+    })
+
+    regressions = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+
+    print_report(report, regressions)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+
+    return 1 if regressions else 0
+
+
 if __name__ == "__main__":
-    # Instalasi numpy jika belum ada (biasanya sudah ada dengan mediapipe/opencv)
     try:
-        run_benchmark()
+        sys.exit(main())
     except ImportError as e:
         print("Error: Library kurang lengkap.")
         print(f"Details: {e}")
         print("Coba jalankan: pip install numpy opencv-python mediapipe")
+        sys.exit(2)
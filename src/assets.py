@@ -1,15 +1,21 @@
 import pygame
 import os
-from .config import FISH_ASSET_PATHS, AUDIO_FILES, PLAYER_START_LEVEL
+from .config import (FISH_ASSET_PATHS, AUDIO_FILES, PLAYER_START_LEVEL, TEXT_CACHE_SIZE,
+                     FISH_BASE_SIZES, FISH_SIZE_VARIANTS, FISH_SPRITE_CACHE_SIZE)
+from .cache import LRUCache
 
 class AssetManager:
     def __init__(self):
         self.fish_images = {}
+        self.fish_sprites = LRUCache(FISH_SPRITE_CACHE_SIZE)  # (level, size, state, flipped, tint) -> Surface
+        self.fish_masks = LRUCache(FISH_SPRITE_CACHE_SIZE)    # (level, size, state, flipped) -> Mask
         self.sounds = {}
-        self.fonts = {}
+        self.fonts = {}  # nama ('score', 'ui', ...) atau ukuran (int) -> Font
+        self.text_cache = LRUCache(TEXT_CACHE_SIZE)
 
     def load_assets(self):
         self._load_images()
+        self._prewarm_fish_sprites()
         self._load_sounds()
         self._load_fonts()
 
@@ -33,6 +39,15 @@ class AssetManager:
                 dummy.fill((255, 0, 255)) # Magenta for missing texture
                 self.fish_images[level] = {"closed": dummy, "open": dummy}
 
+    def _prewarm_fish_sprites(self):
+        # Semua varian bot (ukuran x mulut x arah) disiapkan di depan, spawn tinggal lookup
+        for level, base_size in FISH_BASE_SIZES.items():
+            for variant in FISH_SIZE_VARIANTS:
+                for state in ("closed", "open"):
+                    for flipped in (False, True):
+                        self.get_fish_sprite(level, int(base_size * variant), state, flipped)
+                        self.get_fish_mask(level, int(base_size * variant), state, flipped)
+
     def _load_sounds(self):
         print("Loading Audio...")
         # Initialize mixer if not already
@@ -66,11 +81,57 @@ class AssetManager:
         self.fonts['combo'] = pygame.font.Font(None, 70)
         self.fonts['ui'] = pygame.font.Font(None, 32)
 
+    def get_font(self, font):
+        """Font dari registry: nama font yang di-load, atau ukuran default font (dibuat sekali)"""
+        if font not in self.fonts:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.fonts[font] = pygame.font.Font(None, font)
+        return self.fonts[font]
+
+    def render_text(self, text, font, color, antialias=True):
+        """Render text lewat LRU cache. `font` = nama atau ukuran (lihat get_font).
+
+        Surface hasil di-share antar pemanggil: jangan diubah (set_alpha, fill, ...),
+        copy() dulu kalau perlu.
+        """
+        key = (font, text, tuple(color), antialias)
+        surf = self.text_cache.get(key)
+        if surf is None:
+            surf = self.get_font(font).render(text, antialias, color)
+            self.text_cache.put(key, surf)
+        return surf
+
     def get_fish_image(self, level, state="closed"):
         if level in self.fish_images:
             return self.fish_images[level].get(state, self.fish_images[level]["closed"])
         return self.fish_images[PLAYER_START_LEVEL]["closed"] # Fallback
 
+    def get_fish_sprite(self, level, size, state="closed", flipped=False, tint=None):
+        """Fish image yang sudah di-scale (size x size), di-flip horizontal dan di-tint (BLEND_MULT).
+
+        Di-cache per (level, size, state, flipped, tint). Surface di-share: copy() dulu kalau mau diubah.
+        """
+        key = (level, size, state, flipped, tint)
+        sprite = self.fish_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.transform.scale(self.get_fish_image(level, state), (size, size))
+            if tint:
+                sprite.fill(tint, special_flags=pygame.BLEND_MULT)
+            if flipped:
+                sprite = pygame.transform.flip(sprite, True, False)
+            self.fish_sprites.put(key, sprite)
+        return sprite
+
+    def get_fish_mask(self, level, size, state="closed", flipped=False):
+        """pygame.Mask (hitbox per pixel) dari get_fish_sprite, di-cache. Tint tidak mengubah alpha, jadi tidak ikut key"""
+        key = (level, size, state, flipped)
+        mask = self.fish_masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self.get_fish_sprite(level, size, state, flipped))
+            self.fish_masks.put(key, mask)
+        return mask
+
     def play_sound(self, key, volume=1.0):
         if key in self.sounds and self.sounds[key] is not None:
             self.sounds[key].set_volume(volume)
@@ -0,0 +1,100 @@
+import time
+
+import cv2
+
+from .config import (CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS, CAMERA_FOURCC,
+                     CAMERA_BUFFER_SIZE, CAMERA_MAX_DRAIN)
+
+
+def fourcc_to_str(value):
+    value = int(value)
+    return ''.join(chr((value >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00')
+
+
+class CameraCapture:
+    """cv2.VideoCapture dengan negosiasi format + selalu ambil frame paling baru.
+
+    Resolusi, FPS, FOURCC dan CAP_PROP_BUFFERSIZE diminta saat open, lalu
+    nilai yang benar-benar diberikan driver dibaca ulang ke `granted`.
+    Kalau driver tidak menerima CAP_PROP_BUFFERSIZE=1, read() membuang frame
+    yang sudah antre di buffer driver supaya latency input tidak didominasi
+    frame basi.
+    """
+    def __init__(self, index=CAMERA_INDEX, width=CAMERA_WIDTH, height=CAMERA_HEIGHT, fps=CAMERA_FPS,
+                 fourcc=CAMERA_FOURCC, buffer_size=CAMERA_BUFFER_SIZE, max_drain=CAMERA_MAX_DRAIN):
+        self.requested = {'width': width, 'height': height, 'fps': fps, 'fourcc': fourcc,
+                          'buffer_size': buffer_size}
+        self.max_drain = max_drain
+        self.cap = cv2.VideoCapture(index)
+        self.granted = {}
+        if self.cap.isOpened():
+            self._negotiate()
+
+    def _negotiate(self):
+        # FOURCC harus diset sebelum resolusi di beberapa driver (V4L2)
+        if self.requested['fourcc']:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.requested['fourcc']))
+        if self.requested['width'] and self.requested['height']:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.requested['width'])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.requested['height'])
+        if self.requested['fps']:
+            self.cap.set(cv2.CAP_PROP_FPS, self.requested['fps'])
+        buffer_ok = False
+        if self.requested['buffer_size']:
+            buffer_ok = self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.requested['buffer_size'])
+
+        self.granted = {
+            'width': int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': self.cap.get(cv2.CAP_PROP_FPS),
+            'fourcc': fourcc_to_str(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            'buffer_size': int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)) if buffer_ok else None,
+        }
+
+        for key, wanted in self.requested.items():
+            got = self.granted[key]
+            if wanted and got != wanted and not (key == 'fps' and got and abs(got - wanted) < 0.5):
+                print(f"⚠ Camera {key}: diminta {wanted}, driver memberi {got}")
+        print(f"✓ Camera: {self.granted['width']}x{self.granted['height']} @ {self.granted['fps']:.0f} FPS "
+              f"{self.granted['fourcc'] or '?'} (buffer {self.granted['buffer_size'] or 'default'})")
+
+        # Buffer 1 diterima driver: tidak ada antrean, read() langsung tanpa drain
+        self.drain = self.granted['buffer_size'] != 1
+        fps = self.granted['fps'] or self.requested['fps'] or 30
+        self._frame_interval = 1.0 / fps
+        # Threshold 'grab ini menunggu kamera': selesai jauh lebih lambat dari grab frame yang sudah antre
+        self._queued_threshold = 0.3 / fps
+        self._last_frame = None  # Perkiraan waktu frame terakhir yang di-grab dikirim kamera
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        """Seperti cv2.VideoCapture.read(), tapi frame yang sudah antre di-drain dulu"""
+        if not self.drain:
+            return self.cap.read()
+
+        # Jumlah frame yang datang sejak frame terakhir yang kita ambil. Grab sebanyak itu saja:
+        # grab satu lagi setelahnya akan membuang frame terbaru dan menunggu frame berikutnya
+        now = time.perf_counter()
+        queued = 0 if self._last_frame is None else int((now - self._last_frame) / self._frame_interval)
+        grabbed = False
+        for _ in range(max(1, min(self.max_drain + 1, queued))):
+            grab_start = time.perf_counter()
+            if not self.cap.grab():
+                break
+            grabbed = True
+            grab_end = time.perf_counter()
+            if grab_end - grab_start > self._queued_threshold:
+                # Grab yang harus menunggu kamera: frame ini baru datang, sudah paling baru
+                self._last_frame = grab_end
+                break
+            # Frame antre: datang satu interval setelah frame sebelumnya
+            self._last_frame = grab_end if self._last_frame is None else \
+                min(grab_end, self._last_frame + self._frame_interval)
+        if not grabbed:
+            return False, None
+        return self.cap.retrieve()
+
+    def release(self):
+        self.cap.release()
@@ -0,0 +1,32 @@
+import pygame
+
+
+class SimClock:
+    """Waktu game (ms) yang dimajukan manual, bukan dibaca dari jam dinding.
+
+    Game loop memajukannya dengan dt tiap frame; simulasi headless
+    memajukannya dengan langkah tetap sehingga bisa jalan secepat CPU
+    tanpa mengubah timer gameplay (spawn, power-up, animasi).
+    """
+    def __init__(self, start=0):
+        self.now = start
+
+    def advance(self, ms):
+        self.now += ms
+
+    def get_ticks(self):
+        return int(self.now)
+
+
+_clock = None
+
+
+def use_clock(clock):
+    """Pakai `clock` sebagai sumber waktu get_ticks() (None = kembali ke pygame.time.get_ticks)"""
+    global _clock
+    _clock = clock
+
+
+def get_ticks():
+    """Pengganti pygame.time.get_ticks() untuk semua logic/UI game"""
+    return _clock.get_ticks() if _clock is not None else pygame.time.get_ticks()
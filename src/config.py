@@ -7,7 +7,15 @@ SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
 FPS = 60  
 
 
-FACE_DETECTION_SKIP_FRAMES = 2  
+FACE_DETECTION_SKIP_FRAMES = 2  # Cadence awal, selanjutnya diatur DetectionScheduler
+
+# Adaptive detection scheduler: pilih cadence (deteksi tiap N frame kamera)
+# supaya biaya capture + inference per frame muat di budget
+FACE_DETECTION_FRAME_BUDGET_MS = 16.6
+FACE_DETECTION_MIN_SKIP = 1
+FACE_DETECTION_MAX_SKIP = 6
+FACE_MOTION_FAST = 900   # px/detik di layar -> deteksi sesering mungkin
+FACE_MOTION_STILL = 60   # px/detik di layar -> boleh mundur ke MAX_SKIP
 
 # Player Defaults
 PLAYER_START_LEVEL = 2
@@ -29,11 +37,23 @@ FISH_BASE_SIZES = {
     11: 85, 12: 80, 13: 100, 14: 120, 15: 250
 }
 
+# Variasi ukuran bot relatif ke FISH_BASE_SIZES (diskrit supaya sprite bisa di-cache)
+FISH_SIZE_VARIANTS = (0.9, 0.95, 1.0, 1.05, 1.1)
+FISH_SPRITE_CACHE_SIZE = 512
+
 # Spawn Config
 MAX_TOTAL_BOTS = 15
 SPAWN_INTERVAL_GENERAL = 2000  # ms
 PREDATOR_THREAT_ZONE = 250
 
+# Spatial index (uniform grid) untuk collision, magnet dan behavior bot
+SPATIAL_CELL_SIZE = 128
+FISH_BEHAVIOR_RADIUS = PREDATOR_THREAT_ZONE * 1.5 + 32  # Jangkauan behavior terjauh (chase) + margin gerak satu tick
+
+# Swarm engine: semua bot di-update vectorized (NumPy) dalam satu step, untuk populasi besar
+SWARM_ENGINE = False
+SWARM_CAPACITY = 1024
+
 # Computer Vision Config
 MOUTH_OPEN_THRESHOLD = 0.03
 TRACKING_X_MIN = 0.2
@@ -41,6 +61,42 @@ TRACKING_X_MAX = 0.8
 TRACKING_Y_MIN = 0.25
 TRACKING_Y_MAX = 0.75
 
+# Kamera: format yang diminta ke driver (nilai yang diberikan driver dicek saat open)
+CAMERA_INDEX = 0
+CAMERA_WIDTH, CAMERA_HEIGHT = 1280, 720
+CAMERA_FPS = 30
+CAMERA_FOURCC = 'MJPG'     # MJPG menghindari stream YUYV besar yang sering dibatasi FPS-nya
+CAMERA_BUFFER_SIZE = 1     # buffer internal driver, 1 = tanpa antrean frame basi
+CAMERA_MAX_DRAIN = 4       # maks frame antre yang dibuang per read() jika buffer tidak bisa diset
+
+# Input sintetis (--source synthetic) untuk testing tanpa webcam
+SYNTHETIC_FRAME_SIZE = (640, 360)
+SYNTHETIC_FPS = 30
+
+# Face tracking worker: 'thread' (in-process) atau 'process' (MediaPipe di proses terpisah,
+# frame lewat shared memory). Mode 'process' otomatis fallback ke 'thread' kalau gagal.
+CV_WORKER_MODE = 'thread'
+CV_WORKER_MAX_RESTARTS = 2   # Restart worker capture yang mati karena error sebelum game berhenti
+CV_SHARED_RING_SLOTS = 3
+
+# ROI tracking: setelah wajah ketemu, inference hanya pada crop di sekitar wajah
+FACE_ROI_ENABLED = True
+FACE_ROI_MARGIN = 0.35   # tambahan tiap sisi, relatif terhadap ukuran wajah
+FACE_ROI_SIZE = 256      # sisi terpanjang crop setelah di-downsize (px)
+
+# Prediksi + smoothing antar deteksi (One-Euro filter, lalu ekstrapolasi ke waktu render)
+FILTER_MIN_CUTOFF = 1.0        # Hz, makin kecil makin halus saat kepala diam
+FILTER_BETA = 0.01             # makin besar makin responsif saat kepala bergerak cepat
+FILTER_D_CUTOFF = 1.0          # Hz, cutoff untuk estimasi kecepatan
+MOUTH_FILTER_MIN_CUTOFF = 3.0
+MOUTH_FILTER_BETA = 0.0
+PREDICTION_MAX_LEAD_MS = 100   # batas ekstrapolasi ke depan dari deteksi terakhir
+
+# Facecam preview (pojok kanan bawah), toggle dengan tombol C
+SHOW_CAMERA_PREVIEW = True
+PREVIEW_SIZE = (260, 150)
+PREVIEW_FPS = 15
+
 # Power-up Config
 INVINCIBILITY_DURATION = 2000  # ms
 POWER_UP_SPAWN_CHANCE = 0.02   # chance per check
@@ -66,6 +122,7 @@ BOSS_SPAWN_LEVELS = [5, 8, 11, 14]
 BOSS_HEALTH = {5: 3, 8: 5, 11: 7, 14: 10}  
 BOSS_SIZE_MULTIPLIER = 2.5
 BOSS_SPEED = 1.5
+BOSS_TINT = (255, 100, 100)  # Tint merah (BLEND_MULT)
 
 # Achievement 
 ACHIEVEMENTS = {
@@ -95,6 +152,39 @@ DAILY_CHALLENGES = {
 WEATHER_TYPES = ['calm', 'bubbles', 'current', 'deep']
 CURRENT_STRENGTH = 2.0  # pixels per frame when current is active
 
+# Render: 'full' (flip seluruh layar tiap frame) atau 'dirty' (update hanya area yang berubah)
+RENDER_MODE = 'full'
+RENDER_BACKGROUND_REFRESH_MS = 100  # Mode dirty: interval gambar ulang background (ray, current, layer)
+
+# Jumlah maksimum surface text yang di-cache (LRU)
+TEXT_CACHE_SIZE = 512
+
+# Jumlah maksimum glass panel (HUD, menu, notifikasi) yang di-cache
+GLASS_PANEL_CACHE_SIZE = 64
+
+# Fixed timestep: logic jalan SIM_TICK_RATE tick/detik, terlepas dari frame rate render (FPS / --fps)
+SIM_TICK_RATE = 60
+MAX_TICKS_PER_FRAME = 5        # Batas catch-up per frame saat lag
+INTERPOLATION_MAX_JUMP = 64    # px; perpindahan lebih jauh dalam satu tick (spawn ulang dari pool) tidak diinterpolasi
+
+# Simulasi headless (game.py --headless): jumlah tick default
+HEADLESS_TICKS = 10000
+
+# Object pool: jumlah maksimum instance bebas yang disimpan per pool (BotFish, PowerUp, ScorePopup)
+POOL_MAX_SIZE = 64
+
+# Particle system (NumPy): kapasitas awal array + jumlah level fade sprite per style
+PARTICLE_CAPACITY = 512
+PARTICLE_ALPHA_BUCKETS = 16
+
+# Bubbles: sprite di-cache per (size, alpha); alpha dibulatkan ke kelipatan step ini
+BUBBLE_COUNT = 30
+BUBBLE_ALPHA_STEP = 10
+
+# Light rays: gradient di-cache per bucket lebar; BAKED = semua ray jadi satu layer yang di-scroll
+LIGHT_RAY_WIDTH_STEP = 4
+LIGHT_RAYS_BAKED = False
+
 # Game Modes
 GAME_MODES = {
     'classic': {'name': 'Classic', 'desc': 'Mode standar - naik level sampai menang'},
@@ -109,6 +199,7 @@ GAME_MODES = {
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
 SOUNDS_DIR = os.path.join(ASSETS_DIR, 'sounds')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')  # Surface hasil generate (vignette, dll)
 
 FISH_ASSET_PATHS = {
     1:  {"closed": os.path.join(ASSETS_DIR, "Basic Fish 2.png"),      "open": os.path.join(ASSETS_DIR, "Basic Fish 1.png")},
@@ -0,0 +1,126 @@
+import math
+import numpy as np
+import pygame
+from .config import PARTICLE_CAPACITY, PARTICLE_ALPHA_BUCKETS
+
+# Kolom float per partikel: posisi, kecepatan (px/frame), gravitasi (px/frame^2), waktu spawn + umur (ms)
+X, Y, VX, VY, GRAVITY, SPAWN, LIFETIME = range(7)
+
+
+def _render_particle(shape, color, radius, alpha):
+    image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    if shape == 'circle':
+        pygame.draw.circle(image, (*color, alpha), (radius, radius), radius)
+    elif shape == 'star':
+        points = [(radius + math.cos(math.radians(i * 72 - 90)) * radius,
+                   radius + math.sin(math.radians(i * 72 - 90)) * radius) for i in range(5)]
+        pygame.draw.polygon(image, (*color, alpha), points)
+    return image
+
+
+class ParticleSystem:
+    """Partikel disimpan sebagai array NumPy (bukan satu Sprite per partikel).
+
+    update() menggerakkan semua partikel dalam satu langkah vectorized dan
+    membuang yang sudah habis umurnya. draw() memakai sprite yang dirender
+    sekali per (shape, warna, radius) x PARTICLE_ALPHA_BUCKETS level fade,
+    lalu digambar dengan satu Surface.blits.
+    """
+    def __init__(self, capacity=PARTICLE_CAPACITY, alpha_buckets=PARTICLE_ALPHA_BUCKETS):
+        self.data = np.zeros((capacity, 7), dtype=np.float64)
+        self.style = np.zeros(capacity, dtype=np.int32)
+        self.count = 0
+        self.alpha_buckets = alpha_buckets
+        self._styles = {}    # (shape, color, radius, peak_alpha) -> index
+        self._sprites = []   # index -> [Surface per alpha bucket]
+        self._radius = []    # index -> radius
+
+    def __len__(self):
+        return self.count
+
+    def _style_index(self, shape, color, radius, peak_alpha):
+        key = (shape, tuple(color), radius, peak_alpha)
+        index = self._styles.get(key)
+        if index is None:
+            index = self._styles[key] = len(self._sprites)
+            # Bucket 0 = hampir habis, bucket terakhir = alpha penuh
+            self._sprites.append([
+                _render_particle(shape, color, radius, int(peak_alpha * (b + 1) / self.alpha_buckets))
+                for b in range(self.alpha_buckets)])
+            self._radius.append(radius)
+        return index
+
+    def _reserve(self, n):
+        needed = self.count + n
+        if needed > len(self.data):
+            capacity = max(needed, len(self.data) * 2)
+            self.data = np.resize(self.data, (capacity, 7))
+            self.style = np.resize(self.style, capacity)
+        return slice(self.count, needed)
+
+    def emit(self, x, y, now, radius, color, lifetime, velocity=(0, 0), gravity=0.0, shape='circle', peak_alpha=255):
+        """Satu partikel (misal trail)"""
+        rows = self._reserve(1)
+        self.data[rows] = (x, y, velocity[0], velocity[1], gravity, now, lifetime)
+        self.style[rows] = self._style_index(shape, color, radius, peak_alpha)
+        self.count += 1
+
+    def emit_burst(self, x, y, now, count, colors, speed=(2, 5), lifetime=500, radius=4,
+                   shape='circle', gravity=0.2, peak_alpha=255):
+        """Ledakan `count` partikel ke segala arah dari (x, y).
+
+        `colors` satu warna atau list warna (dipilih acak per partikel),
+        `radius` int atau (min, max) inklusif.
+        """
+        rows = self._reserve(count)
+        angles = np.random.uniform(0, 2 * math.pi, count)
+        speeds = np.random.uniform(speed[0], speed[1], count)
+        block = self.data[rows]
+        block[:, X] = x
+        block[:, Y] = y
+        block[:, VX] = np.cos(angles) * speeds
+        block[:, VY] = np.sin(angles) * speeds
+        block[:, GRAVITY] = gravity
+        block[:, SPAWN] = now
+        block[:, LIFETIME] = lifetime
+
+        palette = [colors] if isinstance(colors[0], int) else list(colors)
+        radii = [radius] if isinstance(radius, int) else list(range(radius[0], radius[1] + 1))
+        styles = [self._style_index(shape, color, r, peak_alpha) for color in palette for r in radii]
+        self.style[rows] = np.asarray(styles, dtype=np.int32)[np.random.randint(0, len(styles), count)]
+        self.count += count
+
+    def update(self, now):
+        """Gerakkan semua partikel satu frame dan buang yang umurnya habis"""
+        if not self.count:
+            return
+        live = self.data[:self.count]
+        live[:, X] += live[:, VX]
+        live[:, Y] += live[:, VY]
+        live[:, VY] += live[:, GRAVITY]
+
+        alive = (now - live[:, SPAWN]) < live[:, LIFETIME]
+        if not alive.all():
+            n = int(alive.sum())
+            self.data[:n] = live[alive]
+            self.style[:n] = self.style[:self.count][alive]
+            self.count = n
+
+    def draw(self, surface, now):
+        """Gambar semua partikel, return list rect yang digambar"""
+        if not self.count:
+            return []
+        live = self.data[:self.count]
+        styles = self.style[:self.count]
+        remaining = np.clip(1 - (now - live[:, SPAWN]) / live[:, LIFETIME], 0, 1)
+        buckets = np.minimum((remaining * self.alpha_buckets).astype(np.int32), self.alpha_buckets - 1)
+        radius = np.asarray(self._radius, dtype=np.int32)[styles]
+        xs = live[:, X].astype(np.int32) - radius
+        ys = live[:, Y].astype(np.int32) - radius
+
+        sprites = self._sprites
+        return surface.blits([(sprites[s][b], (x, y)) for s, b, x, y in
+                              zip(styles.tolist(), buckets.tolist(), xs.tolist(), ys.tolist())])
+
+    def clear(self):
+        self.count = 0
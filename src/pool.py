@@ -0,0 +1,45 @@
+from .config import POOL_MAX_SIZE
+
+
+class ObjectPool:
+    """Pool instance yang bisa dipakai ulang lewat reset(...) (BotFish, PowerUp, ScorePopup).
+
+    acquire(*args) mengambil instance bebas lalu memanggil obj.reset(*args)
+    (hit), atau membuat instance baru lewat factory(*args) kalau pool kosong
+    (miss). Objek yang selesai dikembalikan dengan release(); untuk sprite,
+    reclaim() mengembalikan semua yang sudah di-kill sekaligus.
+    """
+    def __init__(self, factory, maxsize=POOL_MAX_SIZE):
+        self.factory = factory
+        self.maxsize = maxsize
+        self._free = []
+        self._in_use = {}  # obj -> None (dict supaya urutan deterministik)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Jumlah instance bebas yang siap dipakai"""
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.misses += 1
+        self._in_use[obj] = None
+        return obj
+
+    def release(self, obj):
+        if obj not in self._in_use:
+            return  # Bukan dari pool ini / sudah di-release
+        del self._in_use[obj]
+        if len(self._free) < self.maxsize:
+            self._free.append(obj)
+
+    def reclaim(self):
+        """Release semua sprite yang sudah tidak ada di group mana pun (alive() False)"""
+        for obj in [obj for obj in self._in_use if not obj.alive()]:
+            self.release(obj)
@@ -0,0 +1,142 @@
+import pygame
+from .config import RENDER_MODE, RENDER_BACKGROUND_REFRESH_MS, INTERPOLATION_MAX_JUMP
+
+
+class FrameRenderer:
+    """Compositing + present satu frame gameplay.
+
+    Mode 'full': background digambar langsung ke layar, sprite ke game layer
+    (persisten, SRCALPHA) lalu di-composite dengan offset shake, `overlay`
+    (vignette) di atas sprite, present pakai flip().
+
+    Mode 'dirty': background (ocean, ray, current, layer + overlay) disimpan di
+    surface persisten dan hanya digambar ulang tiap RENDER_BACKGROUND_REFRESH_MS.
+    Di frame biasa hanya rect yang digambar frame sebelumnya yang di-restore,
+    sprite/UI digambar langsung ke layar, lalu present pakai
+    display.update(rect lama + rect baru). Saat screen shake, refresh background
+    atau overlay full-screen, frame jatuh ke jalur full (composite + flip).
+    Overlay di-bake ke background, jadi di mode ini sprite tidak ikut tertutup overlay.
+
+    Semua yang digambar di atas background harus dilaporkan lewat mark().
+    """
+    def __init__(self, screen, overlay=None, mode=RENDER_MODE, background_refresh_ms=RENDER_BACKGROUND_REFRESH_MS):
+        self.screen = screen
+        self.overlay = overlay
+        self.dirty = mode == 'dirty'
+        self.background_refresh_ms = background_refresh_ms
+        size = screen.get_size()
+        self.background = pygame.Surface(size).convert() if self.dirty else screen
+        self.game_layer = pygame.Surface(size, pygame.SRCALPHA)
+        self.offset = (0, 0)
+        self.full = True
+        self._last_refresh = None
+        self._background_drawn = False
+        self._prev_rects = []
+        self._rects = []
+
+    def invalidate(self):
+        """Frame berikutnya di-restore + present penuh (misal setelah pindah scene)"""
+        self.full = True
+
+    def begin_frame(self, now, shake_offset=(0, 0)):
+        """Mulai frame. Return True kalau background harus digambar ulang ke `self.background`"""
+        self.offset = shake_offset
+        self._rects = []
+        if shake_offset != (0, 0):
+            self.full = True
+        if not self.dirty:
+            return True
+        if self._last_refresh is None or now - self._last_refresh >= self.background_refresh_ms:
+            self._last_refresh = now
+            self._background_drawn = True
+            self.full = True
+            return True
+        return False
+
+    def restore_background(self):
+        if not self.dirty:
+            return
+        if self._background_drawn and self.overlay is not None:
+            self.background.blit(self.overlay, (0, 0))
+        self._background_drawn = False
+        if self.full:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._prev_rects:
+                self.screen.blit(self.background, rect, rect)
+
+    @property
+    def compositing(self):
+        """Sprite lewat game layer (full mode / frame shake) atau langsung ke layar"""
+        return not self.dirty or self.full
+
+    def sprite_layer(self):
+        """Surface tujuan sprite frame ini (koordinat tanpa offset shake)"""
+        if self.compositing:
+            self.game_layer.fill((0, 0, 0, 0))
+            return self.game_layer
+        return self.screen
+
+    def composite_sprites(self):
+        if self.compositing:
+            self.screen.blit(self.game_layer, self.offset)
+
+    def mark(self, rects):
+        """Catat area yang digambar frame ini (Rect, list of Rect, atau None)"""
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self._rects.append(rects)
+        else:
+            self._rects.extend(r for r in rects if r)
+
+    def draw_overlay(self):
+        """Overlay di atas sprite (mode full saja, mode dirty sudah di-bake ke background)"""
+        if not self.dirty and self.overlay is not None:
+            self.screen.blit(self.overlay, (0, 0))
+
+    def present(self, full=False):
+        """Tampilkan frame. `full=True` untuk overlay yang menutup seluruh layar"""
+        if full:
+            self.full = True
+        if not self.dirty or self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_rects + self._rects)
+        # Overlay full-screen / sprite ter-offset shake tidak tercakup rect: restore penuh di frame berikutnya
+        self._prev_rects = [self.screen.get_rect()] if full or self.offset != (0, 0) else self._rects
+        self.full = False
+
+
+class RenderInterpolator:
+    """Render interpolation untuk fixed timestep.
+
+    snapshot() dipanggil sebelum tiap tick logic untuk menyimpan posisi rect.
+    apply(alpha) memindahkan rect sementara ke posisi antara tick sebelumnya
+    dan tick terakhir (alpha = sisa accumulator / panjang tick), restore()
+    mengembalikan posisi asli sebelum logic jalan lagi. Sprite baru atau yang
+    lompat lebih dari max_jump (spawn ulang dari pool) digambar apa adanya.
+    """
+    def __init__(self, max_jump=INTERPOLATION_MAX_JUMP):
+        self.max_jump = max_jump
+        self._prev = {}    # sprite -> topleft tick sebelumnya
+        self._moved = []   # (sprite, topleft asli) yang sedang diinterpolasi
+
+    def snapshot(self, *groups):
+        self._prev = {sprite: sprite.rect.topleft for group in groups for sprite in group}
+
+    def apply(self, alpha):
+        self._moved = []
+        for sprite, (px, py) in self._prev.items():
+            if not sprite.alive():
+                continue
+            x, y = sprite.rect.topleft
+            if abs(x - px) > self.max_jump or abs(y - py) > self.max_jump:
+                continue
+            self._moved.append((sprite, (x, y)))
+            sprite.rect.topleft = (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+
+    def restore(self):
+        for sprite, topleft in self._moved:
+            sprite.rect.topleft = topleft
+        self._moved = []
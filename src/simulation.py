@@ -0,0 +1,325 @@
+import random
+import pygame
+from .config import *
+from .assets import assets
+from .clock import get_ticks
+from .sprites import Player, BotFish, BossFish, PowerUp
+from .particles import ParticleSystem
+from .spatial import SpatialHash
+from .swarm import SwarmEngine
+from .pool import ObjectPool
+from .sources import SyntheticSource
+from .vision import landmarks_to_result
+from .utils import AchievementManager, DailyChallengeManager, WaterCurrent, ScorePopup, get_random_spawn_level
+from .ui import Tutorial, Notification, C_ACCENT, C_HIGHLIGHT, C_DANGER, C_SUCCESS
+
+
+class GameSimulation:
+    """State + logic gameplay satu tick, terpisah dari window, kamera dan render.
+
+    step(player_x, player_y, is_eating) menjalankan satu tick logic (gerak,
+    spawn, collision, boss, power-up, stats) memakai waktu dari clock.get_ticks().
+    game.py membaca state-nya untuk render; mode headless memanggil step()
+    berulang kali secepat CPU dengan input sintetis.
+    """
+    def __init__(self, persistent=True):
+        # Sprite Groups
+        self.all_sprites = pygame.sprite.Group()
+        self.bot_fish_group = pygame.sprite.Group()
+        self.fish_index = SpatialHash()  # Grid posisi bot, di-sync tiap tick
+        self.swarm = SwarmEngine() if SWARM_ENGINE else None  # Opsional: gerak bot vectorized, sprite cuma view
+        self.powerup_group = pygame.sprite.Group()
+        self.boss_group = pygame.sprite.Group()
+
+        # Pool instance yang di-reset ulang, bukan dibuat baru + di-GC
+        self.bot_pool = ObjectPool(BotFish)
+        self.powerup_pool = ObjectPool(PowerUp)
+        self.popup_pool = ObjectPool(ScorePopup)
+
+        # Partikel (NumPy): trail digambar di bawah ikan, burst di atasnya
+        self.trails = ParticleSystem()
+        self.particles = ParticleSystem()
+
+        self.water_current = WaterCurrent()
+        self.daily_challenge = DailyChallengeManager(persistent)
+        self.achievement_manager = AchievementManager(persistent)
+        self.score_popups = []
+        self.reset()
+
+    def reset(self):
+        """Mulai game baru (state sprite, stats, boss, tutorial)"""
+        self.game_over = False
+        self.win = False
+        self.all_sprites.empty()
+        self.bot_fish_group.empty()
+        self.fish_index.clear()
+        if self.swarm is not None: self.swarm.clear()
+        self.particles.clear()
+        self.powerup_group.empty()
+        self.boss_group.empty()
+        self.trails.clear()
+        for popup in self.score_popups:
+            self.popup_pool.release(popup)
+        self.score_popups = []
+
+        self.current_boss = None
+        self.boss_defeated_levels = set()
+        self.game_stats = {
+            'damage_taken': 0, 'fish_in_10s': 0, 'fish_timestamps': [],
+            'ultimates_used': 0, 'powerups_collected': set(), 'bosses_defeated': 0,
+            'survival_time': 0, 'game_start_time': get_ticks(),
+            'last_damage_time': get_ticks()
+        }
+
+        self.player = Player()
+        self.all_sprites.add(self.player)
+        self.last_notified_level = self.player.level
+        self.last_spawn_time = get_ticks()
+        self.last_powerup_spawn = get_ticks()
+        self.notifications = []
+        self.tutorial = Tutorial()
+        self.screen_shake_intensity = 0
+
+    @property
+    def playing(self):
+        return not self.game_over and not self.win
+
+    def activate_ultimate(self):
+        if self.player.activate_ultimate():
+            self.notifications.append(Notification("FEEDING FRENZY!", C_HIGHLIGHT, 2000, 'large'))
+            self.game_stats['ultimates_used'] += 1
+
+    def step(self, player_x, player_y, is_eating):
+        """Satu tick logic. Notifikasi + screen shake tetap jalan setelah game over / win"""
+        if self.playing:
+            self._update_world(player_x, player_y, is_eating)
+            self._handle_collisions()
+
+        # Level Up Check & Notification
+        if self.player.level > self.last_notified_level:
+            self.notifications.append(Notification(f"LEVEL UP! -> {self.player.level}", C_HIGHLIGHT, 2000, 'large'))
+            assets.play_sound('power_up_collect', 0.6)
+            self.last_notified_level = self.player.level
+
+        self.notifications = [n for n in self.notifications if n.update()]
+        if self.screen_shake_intensity > 0: self.screen_shake_intensity -= 1
+
+    def _update_world(self, player_x, player_y, is_eating):
+        player = self.player
+        game_stats = self.game_stats
+        current_time = get_ticks()
+
+        # Stats update
+        if game_stats.get('game_start_time'):
+            time_since_damage = (current_time - game_stats.get('last_damage_time', current_time)) / 1000
+            game_stats['survival_time'] = int(time_since_damage)
+
+        self.water_current.update()
+
+        # Trail
+        if random.random() < 0.3:
+            self.trails.emit(player.rect.centerx, player.rect.centery, current_time,
+                             int(player.current_size * 0.3) // 2, (100, 200, 255), 300, peak_alpha=150)
+
+        player.update(player_x, player_y, is_eating)
+        self.water_current.apply_to_rect(player.rect)
+
+        if self.swarm is not None:
+            self.swarm.step(current_time, player.level, player.rect, player.frozen_enemies, self.water_current)
+        else:
+            # Hanya bot di sekitar player (posisi tick lalu) yang perlu hitung jarak untuk behavior
+            near_player = set(self.fish_index.query_radius(*player.rect.center, FISH_BEHAVIOR_RADIUS))
+            for bot in self.bot_fish_group:
+                bot.update(player.level, player.rect, player.frozen_enemies, bot in near_player)
+                self.water_current.apply_to_rect(bot.rect)
+        self.fish_index.sync(self.bot_fish_group)
+
+        self.particles.update(current_time)
+        self.powerup_group.update()
+        self.trails.update(current_time)
+        active_popups = []
+        for popup in self.score_popups:
+            if popup.update():
+                active_popups.append(popup)
+            else:
+                self.popup_pool.release(popup)
+        self.score_popups = active_popups
+
+        # Daily Challenge
+        reward = self.daily_challenge.update_progress('combo', player.combo_count)
+        if reward > 0:
+            player.add_score(reward)
+            self.notifications.append(Notification(f"Daily Complete! +{reward}", C_SUCCESS, 3000, 'large'))
+
+        # Boss Logic
+        if self.current_boss:
+            self.current_boss.update(player.rect)
+            if self.current_boss.defeated:
+                player.add_score(self.current_boss.boss_level * 20)
+                game_stats['bosses_defeated'] += 1
+                self.notifications.append(Notification("BOSS DEFEATED!", C_HIGHLIGHT, 3000, 'large'))
+
+                # Boss explosion particles
+                self.particles.emit_burst(self.current_boss.rect.centerx, self.current_boss.rect.centery,
+                                          current_time, 30, [C_HIGHLIGHT, C_DANGER, (255, 255, 100)],
+                                          speed=(3, 8), lifetime=1500, radius=8, shape='star')
+
+                self.boss_group.remove(self.current_boss)
+                self.current_boss = None
+                self.daily_challenge.update_progress('boss_defeated', game_stats['bosses_defeated'])
+                if game_stats['bosses_defeated'] == 1:
+                    self.achievement_manager.unlock('boss_slayer')
+
+        # Spawn Boss
+        for boss_level in BOSS_SPAWN_LEVELS:
+            if player.level >= boss_level and boss_level not in self.boss_defeated_levels and self.current_boss is None:
+                self.current_boss = BossFish(boss_level)
+                self.boss_group.add(self.current_boss)
+                self.boss_defeated_levels.add(boss_level)
+                self.notifications.append(Notification(" BOSS INCOMING! ", C_DANGER, 3000, 'large'))
+                assets.play_sound('boss_spawn', 0.9)
+                break
+
+        # Magnet
+        if player.magnet_radius > 0 and self.swarm is not None:
+            self.swarm.pull(*player.rect.center, player.magnet_radius, player.level)
+            self.fish_index.sync(self.bot_fish_group)
+        elif player.magnet_radius > 0:
+            for bot in self.fish_index.query_radius(*player.rect.center, player.magnet_radius):
+                if bot.level < player.level:
+                    dx = player.rect.centerx - bot.rect.centerx
+                    dy = player.rect.centery - bot.rect.centery
+                    bot.rect.x += dx * 0.05
+                    bot.rect.y += dy * 0.05
+                    self.fish_index.update(bot)
+
+        # Tutorial Trigger
+        tutorial = self.tutorial
+        if player.score > 20 and 1 not in tutorial.shown_tips:
+            tutorial.current_tip = 2; tutorial.show_next_tip()
+        if player.combo_count >= 3 and 5 not in tutorial.shown_tips:
+            tutorial.current_tip = 3; tutorial.show_next_tip()
+
+        # Spawn Bots
+        if len(self.bot_fish_group) < MAX_TOTAL_BOTS:
+            if current_time - self.last_spawn_time > SPAWN_INTERVAL_GENERAL:
+                # Bot yang sudah di-kill (dimakan/despawn) sudah keluar dari swarm + index di step/sync tick ini
+                self.bot_pool.reclaim()
+                num_to_spawn = random.randint(1, 3)
+                for _ in range(num_to_spawn):
+                    spawn_level = get_random_spawn_level(player.level)
+                    bot = self.bot_pool.acquire(spawn_level)
+                    self.all_sprites.add(bot)
+                    self.bot_fish_group.add(bot)
+                    self.fish_index.update(bot)
+                    if self.swarm is not None: self.swarm.add(bot, current_time)
+                self.last_spawn_time = current_time
+
+        # Spawn Powerup
+        if current_time - self.last_powerup_spawn > 5000:
+            if random.random() < POWER_UP_SPAWN_CHANCE * 100:
+                power_type = random.choice(['speed', 'shield', 'magnet', 'double_xp', 'freeze', 'size_boost'])
+                x = random.randint(100, SCREEN_WIDTH - 100)
+                y = random.randint(100, SCREEN_HEIGHT - 100)
+                self.powerup_pool.reclaim()
+                powerup = self.powerup_pool.acquire(x, y, power_type)
+                self.powerup_group.add(powerup)
+            self.last_powerup_spawn = current_time
+
+    def _handle_collisions(self):
+        player = self.player
+        game_stats = self.game_stats
+        current_time = get_ticks()
+
+        # 1. Player vs Fish
+        # Broad phase: rect dari spatial index, narrow phase: mask per pixel (pre-computed di assets)
+        collisions = [fish for fish in self.fish_index.query_rect(player.rect) if pygame.sprite.collide_mask(player, fish)]
+        for fish in collisions:
+            if player.is_eating and (player.level >= fish.level or player.ultimate_active):
+                player.add_score(fish.level)
+                player.fish_eaten += 1
+                player.add_combo()
+                player.charge_ultimate(10)
+
+                # Logic statistik
+                game_stats['fish_timestamps'].append(current_time)
+                game_stats['fish_timestamps'] = [t for t in game_stats['fish_timestamps'] if current_time - t < 10000]
+                game_stats['fish_in_10s'] = len(game_stats['fish_timestamps'])
+                self.daily_challenge.update_progress('fish_eaten', game_stats['fish_in_10s'])
+
+                # Popup Score
+                score_value = fish.level * (2 if player.double_xp else 1)
+                if player.combo_count >= 10: score_value *= 3
+                elif player.combo_count >= 5: score_value *= 2
+                elif player.combo_count >= 3: score_value = int(score_value * 1.5)
+
+                popup_col = C_HIGHLIGHT if player.combo_count >= 5 else (255, 255, 100)
+                self.score_popups.append(self.popup_pool.acquire(fish.rect.centerx, fish.rect.centery - 20,
+                                                                 score_value, popup_col))
+
+                # Particles
+                self.particles.emit_burst(fish.rect.centerx, fish.rect.centery, current_time, 8, (255, 200, 50),
+                                          speed=(2, 5), lifetime=500, radius=4)
+
+                fish.kill()
+                self.fish_index.remove(fish)
+                assets.play_sound('eat', 0.5)
+
+            elif player.level < fish.level and not player.ultimate_active:
+                is_dead = player.take_damage()
+                self.screen_shake_intensity = 15
+                game_stats['damage_taken'] += 1
+                game_stats['last_damage_time'] = current_time
+
+                # Blood particles - menyebar merata ke segala arah
+                # Speed lebih rendah agar tidak terlalu cepat, variasi warna merah untuk efek lebih natural
+                self.particles.emit_burst(player.rect.centerx, player.rect.centery, current_time, 12,
+                                          [C_DANGER, (255, 100, 100), (200, 50, 50)], speed=(2, 4),
+                                          lifetime=500, radius=(3, 6))
+
+                if is_dead:
+                    self.game_over = True
+                    assets.play_sound('game_over', 0.8)
+
+        # 2. Player vs Boss
+        if self.current_boss and pygame.sprite.collide_rect(player, self.current_boss) \
+                and pygame.sprite.collide_mask(player, self.current_boss):
+            if player.is_eating and player.ultimate_active:
+                self.current_boss.take_damage()
+                self.screen_shake_intensity = 10
+            elif not player.invincible:
+                is_dead = player.take_damage()
+                self.screen_shake_intensity = 20
+                game_stats['damage_taken'] += 1
+                if is_dead:
+                    self.game_over = True
+                    assets.play_sound('game_over', 0.8)
+
+        # 3. Player vs Powerup
+        for powerup in pygame.sprite.spritecollide(player, self.powerup_group, True):
+            player.activate_powerup(powerup.power_type)
+            game_stats['powerups_collected'].add(powerup.power_type)
+            self.notifications.append(Notification(f"{powerup.power_type.upper()}!", C_ACCENT, 1500))
+            assets.play_sound('power_up_collect', 0.7)
+            self.daily_challenge.update_progress('powerups', len(game_stats['powerups_collected']))
+
+        self.daily_challenge.update_progress('survival_time', game_stats['survival_time'])
+        self.achievement_manager.check_achievements(player, game_stats)
+
+        # Win Condition
+        if player.score >= TOTAL_SCORE_TO_WIN and not self.win:
+            self.win = True
+            player.level = MAX_LEVEL
+            assets.play_sound('victory', 0.8)
+
+
+class SyntheticInput:
+    """Input terskrip untuk simulasi headless: landmark SyntheticSource di waktu game, tanpa kamera/thread"""
+    def __init__(self, seed=0):
+        self.source = SyntheticSource(seed=seed, realtime=False)
+
+    def __call__(self, now_ms):
+        """Return (player_x, player_y, is_eating) untuk waktu game `now_ms`"""
+        t = now_ms / 1000.0
+        result = landmarks_to_result(self.source.landmarks_at(t), t)
+        return result.player_x, result.player_y, result.is_eating
@@ -0,0 +1,166 @@
+import math
+import os
+import time
+
+import cv2
+import numpy as np
+
+from .camera import CameraCapture
+from .config import SYNTHETIC_FRAME_SIZE, SYNTHETIC_FPS
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+FACE_LANDMARK_COUNT = 478
+
+
+class _Pacer:
+    """Tahan read() ke rate FPS sumber supaya file berperilaku seperti kamera live"""
+    def __init__(self, fps, realtime):
+        self.interval = 1.0 / fps if fps and fps > 0 else 0.0
+        self.realtime = realtime
+        self._next = None
+
+    def wait(self):
+        if not self.realtime or not self.interval:
+            return
+        now = time.perf_counter()
+        if self._next is None or now - self._next > self.interval:
+            self._next = now
+        elif self._next > now:
+            time.sleep(self._next - now)
+        self._next += self.interval
+
+
+class VideoFileSource:
+    """Rekaman video (mp4/avi/...) sebagai pengganti kamera"""
+    def __init__(self, path, loop=True, realtime=True):
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30
+        self.pacer = _Pacer(self.fps, realtime)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        self.pacer.wait()
+        success, frame = self.cap.read()
+        if not success and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = self.cap.read()
+        return success, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageSequenceSource:
+    """Folder berisi frame (diurutkan berdasarkan nama file)"""
+    def __init__(self, directory, fps=30, loop=True, realtime=True):
+        self.files = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                            if name.lower().endswith(IMAGE_EXTENSIONS)) if os.path.isdir(directory) else []
+        self.fps = fps
+        self.loop = loop
+        self.pacer = _Pacer(fps, realtime)
+        self.index = 0
+
+    def isOpened(self):
+        return bool(self.files)
+
+    def read(self):
+        if self.index >= len(self.files):
+            if not self.loop or not self.files:
+                return False, None
+            self.index = 0
+        self.pacer.wait()
+        frame = cv2.imread(self.files[self.index])
+        self.index += 1
+        return frame is not None, frame
+
+    def release(self):
+        self.files = []
+
+
+class SyntheticSource:
+    """Generator landmark sintetis (tanpa kamera dan tanpa MediaPipe).
+
+    Wajah bergerak di lintasan Lissajous dan membuka mulut secara periodik.
+    Frame yang dihasilkan hanya gambar sederhana untuk preview; tracker
+    membaca landmark langsung dari `points` (koordinat ternormalisasi setelah flip).
+    """
+    provides_landmarks = True
+
+    def __init__(self, size=SYNTHETIC_FRAME_SIZE, fps=SYNTHETIC_FPS, seed=0, realtime=True, max_frames=None):
+        self.size = size
+        self.fps = fps
+        self.max_frames = max_frames
+        self.pacer = _Pacer(fps, realtime)
+        rng = np.random.default_rng(seed)
+        # Bentuk wajah tetap: titik acak di dalam elips, dinormalisasi ke [-1, 1]
+        angles = rng.uniform(0, 2 * math.pi, FACE_LANDMARK_COUNT)
+        radii = np.sqrt(rng.uniform(0, 1, FACE_LANDMARK_COUNT))
+        self._shape = np.stack([np.cos(angles) * radii * 0.8, np.sin(angles) * radii], axis=1).astype(np.float32)
+        self._phase = rng.uniform(0, 2 * math.pi)
+        self.frame_index = 0
+        self.points = None
+        self._frame = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+
+    def isOpened(self):
+        return True
+
+    def landmarks_at(self, t):
+        """Landmark (N, 2) ternormalisasi untuk waktu t (detik)"""
+        cx = 0.5 + 0.25 * math.sin(t * 0.9 + self._phase)
+        cy = 0.5 + 0.2 * math.sin(t * 1.3)
+        face_w, face_h = 0.12, 0.18
+        points = self._shape * (face_w, face_h) + (cx, cy)
+        mouth_open = 0.06 if math.sin(t * 2.0) > 0.3 else 0.005
+        points[1] = (cx, cy)                                     # nose tip
+        points[13] = (cx, cy + face_h * 0.45)                    # upper lip
+        points[14] = (cx, cy + face_h * 0.45 + mouth_open)       # lower lip
+        return points
+
+    def read(self):
+        if self.max_frames is not None and self.frame_index >= self.max_frames:
+            return False, None
+        self.pacer.wait()
+        t = self.frame_index / self.fps
+        self.frame_index += 1
+        self.points = self.landmarks_at(t)
+
+        # Preview: gambar di posisi ter-mirror, karena worker akan flip frame
+        width, height = self.size
+        self._frame.fill(30)
+        nose_x, nose_y = self.points[1]
+        center = (int((1 - nose_x) * width), int(nose_y * height))
+        cv2.ellipse(self._frame, center, (int(0.12 * width), int(0.18 * height)), 0, 0, 360, (180, 200, 220), -1)
+        return True, self._frame.copy()
+
+    def release(self):
+        pass
+
+
+def open_source(spec='camera', realtime=True):
+    """Buka input source dari spesifikasi CLI.
+
+    - ``camera`` / ``camera:<index>``  -> kamera live
+    - ``video:<path>``                 -> file video
+    - ``frames:<dir>``                 -> folder frame
+    - ``synthetic``                    -> landmark sintetis (tanpa MediaPipe)
+
+    Path tanpa prefix dideteksi otomatis (folder = frames, file = video).
+    """
+    kind, _, arg = spec.partition(':')
+    if kind == 'camera':
+        return CameraCapture(int(arg)) if arg else CameraCapture()
+    if kind == 'video':
+        return VideoFileSource(arg, realtime=realtime)
+    if kind == 'frames':
+        return ImageSequenceSource(arg, realtime=realtime)
+    if kind == 'synthetic':
+        return SyntheticSource(realtime=realtime)
+    if os.path.isdir(spec):
+        return ImageSequenceSource(spec, realtime=realtime)
+    if os.path.isfile(spec):
+        return VideoFileSource(spec, realtime=realtime)
+    raise ValueError(f"Input source tidak dikenal: {spec!r}")
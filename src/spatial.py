@@ -0,0 +1,91 @@
+from .config import SPATIAL_CELL_SIZE
+
+
+class SpatialHash:
+    """Uniform grid untuk query 'siapa di dekat sini' tanpa loop ke semua objek.
+
+    Objek (sprite dengan `.rect`) didaftarkan ke setiap cell yang disentuh
+    rect-nya. update() hanya memindahkan objek kalau cell-nya berubah, jadi
+    sync per tick murah walaupun jumlah ikan ribuan.
+    """
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> {obj: None} (dict supaya urutan deterministik)
+        self._spans = {}  # obj -> (cx0, cy0, cx1, cy1)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, obj):
+        return obj in self._spans
+
+    def _span(self, rect):
+        size = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def update(self, obj):
+        """Daftarkan / pindahkan objek sesuai posisi `obj.rect` sekarang"""
+        span = self._span(obj.rect)
+        old = self._spans.get(obj)
+        if old == span:
+            return
+        if old is not None:
+            self._unlink(obj, old)
+        self._spans[obj] = span
+        cx0, cy0, cx1, cy1 = span
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), {})[obj] = None
+
+    def remove(self, obj):
+        span = self._spans.pop(obj, None)
+        if span is not None:
+            self._unlink(obj, span)
+
+    def _unlink(self, obj, span):
+        cx0, cy0, cx1, cy1 = span
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(obj, None)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def sync(self, objects):
+        """Update semua objek di `objects` dan buang yang sudah tidak ada (misal sprite yang di-kill)"""
+        seen = set()
+        for obj in objects:
+            self.update(obj)
+            seen.add(obj)
+        for obj in [obj for obj in self._spans if obj not in seen]:
+            self.remove(obj)
+
+    def clear(self):
+        self.cells.clear()
+        self._spans.clear()
+
+    def _candidates(self, cx0, cy0, cx1, cy1):
+        found = {}
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def query_rect(self, rect):
+        """Objek yang rect-nya bertabrakan dengan `rect`"""
+        return [obj for obj in self._candidates(*self._span(rect)) if obj.rect.colliderect(rect)]
+
+    def query_radius(self, x, y, radius):
+        """Objek yang center rect-nya berjarak < radius dari (x, y)"""
+        size = self.cell_size
+        span = (int(x - radius) // size, int(y - radius) // size, int(x + radius) // size, int(y + radius) // size)
+        r2 = radius * radius
+        result = []
+        for obj in self._candidates(*span):
+            cx, cy = obj.rect.center
+            if (cx - x) ** 2 + (cy - y) ** 2 < r2:
+                result.append(obj)
+        return result
@@ -3,133 +3,82 @@ import math
 import random
 from .config import *
 from .assets import assets
+from .clock import get_ticks
 from .ui import draw_level_indicator, draw_progress_bar
 
 
-class TrailParticle(pygame.sprite.Sprite):
-    def __init__(self, x, y, size, color=(100, 200, 255)):
-        super().__init__()
-        self.x = x
-        self.y = y
-        self.size = size
-        self.alpha = 150
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (*color, self.alpha), (size//2, size//2), size//2)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.spawn_time = pygame.time.get_ticks()
-        
-    def update(self):
-        elapsed = pygame.time.get_ticks() - self.spawn_time
-        if elapsed > 300:
-            self.kill()
-            return
-        self.alpha = int(150 * (1 - elapsed / 300))
-        self.image.fill((0, 0, 0, 0))
-        pygame.draw.circle(self.image, (100, 200, 255, self.alpha), (self.size//2, self.size//2), self.size//2)
-
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y, color, velocity, lifetime=1000, size=5, particle_type='circle'):
-        super().__init__()
-        self.x = x
-        self.y = y
-        self.vx, self.vy = velocity
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.particle_type = particle_type
-        
-        self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.spawn_time = pygame.time.get_ticks()
-        
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.2  # Gravity
-        
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - self.spawn_time
-        
-        if elapsed >= self.lifetime:
-            self.kill()
-            return
-        
-        # Fade out
-        alpha = int(255 * (1 - elapsed / self.lifetime))
-        self.image.fill((0, 0, 0, 0))
-        
-        if self.particle_type == 'circle':
-            pygame.draw.circle(self.image, (*self.color, alpha), (self.size, self.size), self.size)
-        elif self.particle_type == 'star':
-            points = []
-            for i in range(5):
-                angle = math.radians(i * 72 - 90)
-                points.append((self.size + math.cos(angle) * self.size, 
-                             self.size + math.sin(angle) * self.size))
-            if len(points) >= 3:
-                pygame.draw.polygon(self.image, (*self.color, alpha), points)
-        
-        self.rect.center = (int(self.x), int(self.y))
-
 class PowerUp(pygame.sprite.Sprite):
+    # Warna power-up
+    COLORS = {
+        'speed': (0, 255, 255),      # Cyan
+        'shield': (255, 215, 0),     # Gold
+        'magnet': (255, 0, 255),     # Magenta
+        'double_xp': (0, 255, 0),    # Green
+        'freeze': (100, 200, 255),   # Light blue
+        'size_boost': (255, 100, 0)  # Orange
+    }
+    _images = {}  # power_type -> Surface, di-share semua power-up
+
     def __init__(self, x, y, power_type):
         super().__init__()
-        self.power_type = power_type
         self.size = 30
-        
-        # Warna power-up
-        colors = {
-            'speed': (0, 255, 255),      # Cyan
-            'shield': (255, 215, 0),     # Gold
-            'magnet': (255, 0, 255),     # Magenta
-            'double_xp': (0, 255, 0),    # Green
-            'freeze': (100, 200, 255),   # Light blue
-            'size_boost': (255, 100, 0)  # Orange
-        }
-        
-        self.color = colors.get(power_type, (255, 255, 255))
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (self.size // 2, self.size // 2), self.size // 2)
-        pygame.draw.circle(self.image, (255, 255, 255), (self.size // 2, self.size // 2), self.size // 2 - 3, 2)
-        
+        self.reset(x, y, power_type)
+
+    @classmethod
+    def get_image(cls, power_type, size):
+        image = cls._images.get(power_type)
+        if image is None:
+            color = cls.COLORS.get(power_type, (255, 255, 255))
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(image, color, (size // 2, size // 2), size // 2)
+            pygame.draw.circle(image, (255, 255, 255), (size // 2, size // 2), size // 2 - 3, 2)
+            cls._images[power_type] = image
+        return image
+
+    def reset(self, x, y, power_type):
+        """Inisialisasi ulang (dipakai juga oleh ObjectPool)"""
+        self.power_type = power_type
+        self.color = self.COLORS.get(power_type, (255, 255, 255))
+        self.image = self.get_image(power_type, self.size)
         self.rect = self.image.get_rect(center=(x, y))
         self.float_offset = random.uniform(0, math.pi * 2)
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = get_ticks()
         
     def update(self):
         # Floating animation
-        time = pygame.time.get_ticks() / 1000.0
+        time = get_ticks() / 1000.0
         self.rect.y += math.sin(time * 3 + self.float_offset) * 0.5
         
         # Despawn after 10 seconds
-        if pygame.time.get_ticks() - self.spawn_time > 10000:
+        if get_ticks() - self.spawn_time > 10000:
             self.kill()
 
 class BotFish(pygame.sprite.Sprite):
     def __init__(self, level, behavior='normal'):
         super().__init__()
+        self.reset(level, behavior)
+
+    def reset(self, level, behavior='normal'):
+        """Inisialisasi ulang sebagai bot baru (dipakai juga oleh ObjectPool)"""
         self.level = level
         self.behavior = behavior if behavior != 'normal' else random.choice(FISH_BEHAVIORS)
         
-        # Get images from AssetManager
-        closed_base = assets.get_fish_image(level, "closed")
-        open_base = assets.get_fish_image(level, "open")
-
         base_scale = FISH_BASE_SIZES[level]
-        scale = base_scale * random.uniform(0.9, 1.1)
+        scale = base_scale * random.choice(FISH_SIZE_VARIANTS)
         size = (int(scale), int(scale))
 
-        self.closed_image = pygame.transform.scale(closed_base, size)
-        self.open_image = pygame.transform.scale(open_base, size)
-
         self.direction = random.choice([-1, 1])
         if self.direction == 1:
             start_x = -size[0]
         else:
             start_x = SCREEN_WIDTH + size[0]
-            self.closed_image = pygame.transform.flip(self.closed_image, True, False)
-            self.open_image = pygame.transform.flip(self.open_image, True, False)
+
+        # Get images from AssetManager (sudah di-scale + flip, dari cache)
+        flipped = self.direction == -1
+        self.closed_image = assets.get_fish_sprite(level, size[0], "closed", flipped)
+        self.open_image = assets.get_fish_sprite(level, size[0], "open", flipped)
+        self.closed_mask = assets.get_fish_mask(level, size[0], "closed", flipped)
+        self.open_mask = assets.get_fish_mask(level, size[0], "open", flipped)
 
         self.image = self.closed_image
 
@@ -139,7 +88,7 @@ class BotFish(pygame.sprite.Sprite):
         self.speed = random.randint(1, 3) + (self.level / 3)
         self.base_speed = self.speed
 
-        self.animation_timer = pygame.time.get_ticks()
+        self.animation_timer = get_ticks()
         self.animation_interval = random.randint(500, 2000)
         
         self.frozen = False
@@ -151,7 +100,7 @@ class BotFish(pygame.sprite.Sprite):
         self.school_target = None
         self.original_y = start_y
 
-    def update(self, player_level, player_rect, frozen=False):
+    def update(self, player_level, player_rect, frozen=False, near_player=True):
         # Apply freeze effect
         if frozen:
             self.speed = self.base_speed * 0.3
@@ -161,6 +110,10 @@ class BotFish(pygame.sprite.Sprite):
         # Base movement
         self.rect.x += self.speed * self.direction
         
+        # Jarak ke player cuma dihitung kalau spatial index bilang bot ini dekat (near_player)
+        distance = math.hypot(self.rect.centerx - player_rect.centerx, self.rect.centery - player_rect.centery) \
+            if near_player else math.inf
+        
         # Behavior-specific movement
         if self.behavior == 'zigzag':
             self.zigzag_phase += 0.1
@@ -168,8 +121,6 @@ class BotFish(pygame.sprite.Sprite):
             
         elif self.behavior == 'flee' and self.level < player_level:
             # Flee from player if we're prey
-            distance = math.hypot(self.rect.centerx - player_rect.centerx, 
-                                 self.rect.centery - player_rect.centery)
             if distance < self.flee_distance:
                 # Run away!
                 if self.rect.centery < player_rect.centery:
@@ -181,8 +132,6 @@ class BotFish(pygame.sprite.Sprite):
                 
         elif self.behavior == 'chase' and self.level > player_level and not frozen:
             # Actively chase player if we're predator
-            distance = math.hypot(self.rect.centerx - player_rect.centerx, 
-                                 self.rect.centery - player_rect.centery)
             if distance < PREDATOR_THREAT_ZONE * 1.5:
                 dx = player_rect.centerx - self.rect.centerx
                 dy = player_rect.centery - self.rect.centery
@@ -193,8 +142,6 @@ class BotFish(pygame.sprite.Sprite):
         # Original Predator behavior (for normal behavior type)
         elif self.behavior == 'normal':
             if self.level > player_level and not frozen:
-                distance = math.hypot(self.rect.centerx - player_rect.centerx, 
-                                     self.rect.centery - player_rect.centery)
                 if distance < PREDATOR_THREAT_ZONE:
                     if self.rect.centery < player_rect.centery:
                         self.rect.y += 1
@@ -205,7 +152,7 @@ class BotFish(pygame.sprite.Sprite):
         self.rect.y = max(30, min(SCREEN_HEIGHT - 30, self.rect.y))
 
         # Animation
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         if current_time - self.animation_timer > self.animation_interval:
             self.animation_timer = current_time
             center = self.rect.center
@@ -220,8 +167,13 @@ class BotFish(pygame.sprite.Sprite):
            (self.direction == -1 and self.rect.right < -50):
             self.kill()
     
+    @property
+    def mask(self):
+        # Dipakai pygame.sprite.collide_mask (narrow phase setelah cek rect)
+        return self.open_mask if self.image is self.open_image else self.closed_mask
+
     def draw_indicator(self, surface, player_level):
-        draw_level_indicator(surface, self.level, self.rect.centerx, self.rect.centery, 
+        return draw_level_indicator(surface, self.level, self.rect.centerx, self.rect.centery, 
                            is_player=False, player_level=player_level)
 
 
@@ -234,24 +186,12 @@ class BossFish(pygame.sprite.Sprite):
         self.health = BOSS_HEALTH.get(boss_level, 5)
         self.max_health = self.health
         
-        # Get images
-        closed_base = assets.get_fish_image(self.level, "closed")
-        open_base = assets.get_fish_image(self.level, "open")
-        
         base_scale = FISH_BASE_SIZES[self.level] * BOSS_SIZE_MULTIPLIER
         size = (int(base_scale), int(base_scale))
-        
-        self.closed_image = pygame.transform.scale(closed_base, size)
-        self.open_image = pygame.transform.scale(open_base, size)
-        
-        # Tint boss red
-        self.closed_image.fill((255, 100, 100), special_flags=pygame.BLEND_MULT)
-        self.open_image.fill((255, 100, 100), special_flags=pygame.BLEND_MULT)
+        self.size = size[0]
         
         self.direction = random.choice([-1, 1])
-        if self.direction == -1:
-            self.closed_image = pygame.transform.flip(self.closed_image, True, False)
-            self.open_image = pygame.transform.flip(self.open_image, True, False)
+        self.flip_images()
         
         self.image = self.closed_image
         
@@ -262,13 +202,13 @@ class BossFish(pygame.sprite.Sprite):
         self.speed = BOSS_SPEED
         self.phase = 0
         self.attack_pattern = 'chase'
-        self.pattern_timer = pygame.time.get_ticks()
+        self.pattern_timer = get_ticks()
         self.invincible = False
         self.invincible_timer = 0
         self.defeated = False
         
     def update(self, player_rect):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
         # Change attack pattern every 3 seconds
         if current_time - self.pattern_timer > 3000:
@@ -313,15 +253,23 @@ class BossFish(pygame.sprite.Sprite):
             self.image.set_alpha(255)
     
     def flip_images(self):
-        self.closed_image = pygame.transform.flip(self.closed_image, True, False)
-        self.open_image = pygame.transform.flip(self.open_image, True, False)
+        """Ambil image sesuai self.direction (tint merah boss). Copy karena alpha-nya diubah saat flash"""
+        flipped = self.direction == -1
+        self.closed_image = assets.get_fish_sprite(self.level, self.size, "closed", flipped, BOSS_TINT).copy()
+        self.open_image = assets.get_fish_sprite(self.level, self.size, "open", flipped, BOSS_TINT).copy()
+        self.closed_mask = assets.get_fish_mask(self.level, self.size, "closed", flipped)
+        self.open_mask = assets.get_fish_mask(self.level, self.size, "open", flipped)
+    
+    @property
+    def mask(self):
+        return self.open_mask if self.image is self.open_image else self.closed_mask
     
     def take_damage(self):
         if self.invincible:
             return False
         self.health -= 1
         self.invincible = True
-        self.invincible_timer = pygame.time.get_ticks() + 500
+        self.invincible_timer = get_ticks() + 500
         assets.play_sound('boss_hit', 0.8)
         if self.health <= 0:
             self.defeated = True
@@ -335,16 +283,17 @@ class BossFish(pygame.sprite.Sprite):
         y = 20
         
         # Background
-        pygame.draw.rect(surface, (60, 60, 60), (x, y, bar_width, bar_height))
+        rect = pygame.draw.rect(surface, (60, 60, 60), (x, y, bar_width, bar_height))
         # Health
         health_width = int(bar_width * (self.health / self.max_health))
         pygame.draw.rect(surface, (255, 0, 0), (x, y, health_width, bar_height))
         # Border
         pygame.draw.rect(surface, (255, 255, 255), (x, y, bar_width, bar_height), 2)
         # Text
-        boss_text = assets.fonts['indicator_bold'].render(f"BOSS LV.{self.level}", True, (255, 255, 0))
+        boss_text = assets.render_text(f"BOSS LV.{self.level}", 'indicator_bold', (255, 255, 0))
         text_rect = boss_text.get_rect(center=(SCREEN_WIDTH // 2, y + bar_height + 15))
         surface.blit(boss_text, text_rect)
+        return rect.union(text_rect)
 
 
 class Player(pygame.sprite.Sprite):
@@ -390,18 +339,21 @@ class Player(pygame.sprite.Sprite):
 
     def load_and_scale_images(self):
         size = int(self.current_size * self.size_multiplier)
-        # Get raw images from AssetManager
-        raw_closed = assets.get_fish_image(self.level, "closed")
-        raw_open = assets.get_fish_image(self.level, "open")
-        
-        self.closed_mouth_image = pygame.transform.scale(raw_closed, (size, size))
-        self.open_mouth_image = pygame.transform.scale(raw_open, (size, size))
+        # Scaled images dari cache AssetManager
+        self.closed_mouth_image = assets.get_fish_sprite(self.level, size, "closed")
+        self.open_mouth_image = assets.get_fish_sprite(self.level, size, "open")
+        self.closed_mouth_mask = assets.get_fish_mask(self.level, size, "closed")
+        self.open_mouth_mask = assets.get_fish_mask(self.level, size, "open")
         self.image = self.open_mouth_image if self.is_eating else self.closed_mouth_image
         center = self.rect.center
         self.rect = self.image.get_rect(center=center)
 
+    @property
+    def mask(self):
+        return self.open_mouth_mask if self.image is self.open_mouth_image else self.closed_mouth_mask
+
     def update(self, x, y, eating):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
         # Movement with speed multiplier
         target_pos = (x, y)
@@ -495,7 +447,7 @@ class Player(pygame.sprite.Sprite):
         self.combo_count += 1
         self.max_combo = max(self.max_combo, self.combo_count)
         self.combo_timer = COMBO_TIMEOUT
-        self.combo_end_time = pygame.time.get_ticks() + COMBO_TIMEOUT
+        self.combo_end_time = get_ticks() + COMBO_TIMEOUT
         
         # Play combo sound with increasing pitch feel
         if self.combo_count == 3:
@@ -514,13 +466,13 @@ class Player(pygame.sprite.Sprite):
         self.health -= 1
         self.invincible = True
         self.invincible_timer = INVINCIBILITY_DURATION
-        self.invincible_end_time = pygame.time.get_ticks() + INVINCIBILITY_DURATION
+        self.invincible_end_time = get_ticks() + INVINCIBILITY_DURATION
         self.combo_count = 0
         assets.play_sound('hit', 0.8)
         return self.health <= 0
     
     def activate_powerup(self, power_type):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         self.active_powerups[power_type] = current_time + POWER_UP_DURATION[power_type]
         
         if power_type == 'speed':
@@ -566,7 +518,7 @@ class Player(pygame.sprite.Sprite):
         if self.ultimate_charge >= ULTIMATE_CHARGE_MAX and not self.ultimate_active:
             self.ultimate_active = True
             self.ultimate_timer = ULTIMATE_DURATION
-            self.ultimate_end_time = pygame.time.get_ticks() + ULTIMATE_DURATION
+            self.ultimate_end_time = get_ticks() + ULTIMATE_DURATION
             self.ultimate_charge = 0
             self.invincible = True
             assets.play_sound('ultimate_activate', 0.8)
@@ -579,7 +531,7 @@ class Player(pygame.sprite.Sprite):
         del self.ultimate_end_time
     
     def draw_indicator(self, surface):
-        draw_level_indicator(surface, self.level, self.rect.centerx, self.rect.centery, is_player=True)
+        return draw_level_indicator(surface, self.level, self.rect.centerx, self.rect.centery, is_player=True)
     
     def draw_ui(self, surface):
         # Health hearts
@@ -605,30 +557,30 @@ class Player(pygame.sprite.Sprite):
                          self.ultimate_charge / ULTIMATE_CHARGE_MAX,
                          bg_color=(50, 50, 50), fill_color=(255, 215, 0))
         
-        ult_text = assets.fonts['ui'].render("ULTIMATE", True, (255, 255, 255))
+        ult_text = assets.render_text("ULTIMATE", 'ui', (255, 255, 255))
         surface.blit(ult_text, (bar_x, bar_y - 25))
         
         if self.ultimate_active:
-            timer_sec = max(0, (self.ultimate_end_time - pygame.time.get_ticks()) / 1000)
-            timer_text = assets.fonts['ui'].render(f"{timer_sec:.1f}s", True, (255, 215, 0))
+            timer_sec = max(0, (self.ultimate_end_time - get_ticks()) / 1000)
+            timer_text = assets.render_text(f"{timer_sec:.1f}s", 'ui', (255, 215, 0))
             surface.blit(timer_text, (bar_x + bar_width + 10, bar_y))
         
         # Active power-ups
         powerup_y = 190
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         for power_type, end_time in self.active_powerups.items():
             remaining = (end_time - current_time) / 1000
             if remaining > 0:
-                text = assets.fonts['ui'].render(f"{power_type.upper()}: {remaining:.1f}s", True, (255, 255, 255))
+                text = assets.render_text(f"{power_type.upper()}: {remaining:.1f}s", 'ui', (255, 255, 255))
                 surface.blit(text, (10, powerup_y))
                 powerup_y += 30
         
         # Combo counter
         if self.combo_count >= 3:
-            combo_text = assets.fonts['combo'].render(f"COMBO x{self.combo_count}!", True, (255, 215, 0))
+            combo_text = assets.render_text(f"COMBO x{self.combo_count}!", 'combo', (255, 215, 0))
             combo_rect = combo_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
             # Outline
             for offset in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                outline_text = assets.fonts['combo'].render(f"COMBO x{self.combo_count}!", True, (0, 0, 0))
+                outline_text = assets.render_text(f"COMBO x{self.combo_count}!", 'combo', (0, 0, 0))
                 surface.blit(outline_text, (combo_rect.x + offset[0], combo_rect.y + offset[1]))
             surface.blit(combo_text, combo_rect)
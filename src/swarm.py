@@ -0,0 +1,128 @@
+import numpy as np
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT, PREDATOR_THREAT_ZONE, FISH_BEHAVIORS, SWARM_CAPACITY
+
+# Kolom state per bot (rect top-left + ukuran, gerak, behavior, animasi mulut)
+(X, Y, W, H, SPEED, DIRECTION, BEHAVIOR, PHASE, AMPLITUDE, ORIGINAL_Y,
+ LEVEL, FLEE_DISTANCE, ANIM_TIMER, ANIM_INTERVAL, MOUTH_OPEN) = range(15)
+COLUMNS = 15
+
+BEHAVIOR_CODES = {name: code for code, name in enumerate(FISH_BEHAVIORS)}
+NORMAL, ZIGZAG, FLEE, CHASE = (BEHAVIOR_CODES[name] for name in ('normal', 'zigzag', 'flee', 'chase'))
+
+
+class SwarmEngine:
+    """Semua bot di-update sebagai array NumPy (structure of arrays).
+
+    step() menjalankan gerak dasar, behavior (zigzag/flee/chase/normal),
+    freeze, water current, batas layar, animasi mulut dan despawn untuk
+    seluruh populasi sekaligus. BotFish hanya jadi view untuk render +
+    collision: rect dan image-nya ditulis ulang dari array tiap step.
+    """
+    def __init__(self, capacity=SWARM_CAPACITY):
+        self.state = np.zeros((capacity, COLUMNS), dtype=np.float64)
+        self.bots = []
+
+    def __len__(self):
+        return len(self.bots)
+
+    def add(self, bot, now):
+        """Daftarkan BotFish yang baru di-spawn (state awal dibaca dari sprite)"""
+        n = len(self.bots)
+        if n >= len(self.state):
+            self.state = np.resize(self.state, (len(self.state) * 2, COLUMNS))
+        self.state[n] = (bot.rect.x, bot.rect.y, bot.rect.width, bot.rect.height, bot.base_speed, bot.direction,
+                         BEHAVIOR_CODES.get(bot.behavior, NORMAL), bot.zigzag_phase, bot.zigzag_amplitude,
+                         bot.original_y, bot.level, bot.flee_distance, now, bot.animation_interval,
+                         bot.image is bot.open_image)
+        self.bots.append(bot)
+
+    def clear(self):
+        self.bots = []
+
+    def _compact(self, keep):
+        n = int(keep.sum())
+        self.state[:n] = self.state[:len(self.bots)][keep]
+        self.bots = [bot for bot, k in zip(self.bots, keep) if k]
+
+    def step(self, now, player_level, player_rect, frozen=False, water_current=None):
+        # Bot yang sudah di-kill dari luar (dimakan, reset) dibuang dulu
+        if self.bots:
+            alive = np.fromiter((bot.alive() for bot in self.bots), dtype=bool, count=len(self.bots))
+            if not alive.all():
+                self._compact(alive)
+        if not self.bots:
+            return
+
+        s = self.state[:len(self.bots)]
+        code = s[:, BEHAVIOR]
+        level = s[:, LEVEL]
+
+        # Base movement (+ freeze)
+        speed = s[:, SPEED] * (0.3 if frozen else 1.0)
+        s[:, X] += speed * s[:, DIRECTION]
+
+        px, py = player_rect.center
+        dx = px - (s[:, X] + s[:, W] / 2)
+        dy = py - (s[:, Y] + s[:, H] / 2)
+        distance = np.hypot(dx, dy)
+
+        zigzag = code == ZIGZAG
+        s[zigzag, PHASE] += 0.1
+        s[zigzag, Y] = s[zigzag, ORIGINAL_Y] + np.sin(s[zigzag, PHASE]) * s[zigzag, AMPLITUDE]
+
+        # Prey kabur menjauh (vertikal) + speed boost
+        flee = (code == FLEE) & (level < player_level) & (distance < s[:, FLEE_DISTANCE])
+        s[flee, Y] += np.where(dy[flee] > 0, -3, 3)
+        s[flee, X] += speed[flee] * s[flee, DIRECTION] * 0.5
+
+        if not frozen:
+            predator = level > player_level
+            chase = (code == CHASE) & predator & (distance < PREDATOR_THREAT_ZONE * 1.5)
+            dist = np.maximum(1, distance[chase])
+            s[chase, X] += dx[chase] / dist * 2
+            s[chase, Y] += dy[chase] / dist * 2
+
+            normal = (code == NORMAL) & predator & (distance < PREDATOR_THREAT_ZONE)
+            s[normal, Y] += np.sign(dy[normal])
+
+        np.clip(s[:, Y], 30, SCREEN_HEIGHT - 30, out=s[:, Y])
+
+        if water_current is not None and water_current.active and water_current.strength > 0:
+            s[:, X] += water_current.direction * water_current.strength
+
+        # Animasi buka/tutup mulut
+        toggle = now - s[:, ANIM_TIMER] > s[:, ANIM_INTERVAL]
+        s[toggle, ANIM_TIMER] = now
+        s[toggle, MOUTH_OPEN] = 1 - s[toggle, MOUTH_OPEN]
+
+        # Despawn setelah keluar layar
+        gone = ((s[:, DIRECTION] == 1) & (s[:, X] > SCREEN_WIDTH + 50)) | \
+               ((s[:, DIRECTION] == -1) & (s[:, X] + s[:, W] < -50))
+        if gone.any():
+            for bot, g in zip(self.bots, gone):
+                if g:
+                    bot.kill()
+            self._compact(~gone)
+            s = self.state[:len(self.bots)]
+
+        self._write_views(s)
+
+    def pull(self, x, y, radius, max_level, factor=0.05):
+        """Tarik bot dengan level < max_level dalam radius ke (x, y) (power-up magnet)"""
+        if not self.bots:
+            return
+        s = self.state[:len(self.bots)]
+        dx = x - (s[:, X] + s[:, W] / 2)
+        dy = y - (s[:, Y] + s[:, H] / 2)
+        pulled = (s[:, LEVEL] < max_level) & (np.hypot(dx, dy) < radius)
+        s[pulled, X] += dx[pulled] * factor
+        s[pulled, Y] += dy[pulled] * factor
+        self._write_views(s)
+
+    def _write_views(self, s):
+        xs = s[:, X].astype(np.int32).tolist()
+        ys = s[:, Y].astype(np.int32).tolist()
+        mouth = (s[:, MOUTH_OPEN] > 0).tolist()
+        for bot, x, y, is_open in zip(self.bots, xs, ys, mouth):
+            bot.rect.topleft = (x, y)
+            bot.image = bot.open_image if is_open else bot.closed_image
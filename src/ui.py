@@ -1,8 +1,10 @@
 import pygame
 import math
 import random
-from .config import SCREEN_WIDTH, SCREEN_HEIGHT
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LEVEL, GLASS_PANEL_CACHE_SIZE
 from .assets import assets
+from .clock import get_ticks
+from .cache import LRUCache
 
 # Colors
 C_DARK_BG = (10, 25, 47)
@@ -16,29 +18,40 @@ C_SUCCESS = (0, 255, 127)
 PAD = 20
 
 # --- OCEAN BACKGROUND ---
-def draw_ocean_background(surface, time_offset=0):
-    """Smooth ocean gradient tanpa garis-garis + subtle animation"""
-    gradient = pygame.Surface((1, SCREEN_HEIGHT))
-    
-    for y in range(SCREEN_HEIGHT):
-        ratio = y / SCREEN_HEIGHT
-        r = int(10 + 25 * ratio)
-        g = int(25 + 60 * ratio)
-        b = int(47 + 90 * ratio)
-        gradient.set_at((0, y), (r, g, b))
-    
-    # Scale 1px gradient menjadi full screen
-    smooth_bg = pygame.transform.smoothscale(gradient, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    surface.blit(smooth_bg, (0, 0))
+_ocean_backdrop = {}  # Gradient + ray statis, dibuat sekali (lihat _get_ocean_backdrop)
 
-    # Light rays (dipertahankan tapi lebih halus)
-    for i in range(5):
-        x = (SCREEN_WIDTH // 5) * i + int(20 * math.sin(time_offset * 0.2 + i))
+def _get_ocean_backdrop():
+    if not _ocean_backdrop:
+        gradient = pygame.Surface((1, SCREEN_HEIGHT))
+        
+        for y in range(SCREEN_HEIGHT):
+            ratio = y / SCREEN_HEIGHT
+            r = int(10 + 25 * ratio)
+            g = int(25 + 60 * ratio)
+            b = int(47 + 90 * ratio)
+            gradient.set_at((0, y), (r, g, b))
+        
+        # Scale 1px gradient menjadi full screen
+        smooth_bg = pygame.transform.smoothscale(gradient, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
         ray_surf = pygame.Surface((3, SCREEN_HEIGHT), pygame.SRCALPHA)
         for y in range(SCREEN_HEIGHT):
             alpha = int(10 * (1 - y / SCREEN_HEIGHT))
             ray_surf.set_at((1, y), (100, 200, 255, alpha))
-        surface.blit(ray_surf, (x, 0))
+        
+        if pygame.display.get_surface() is not None:
+            smooth_bg, ray_surf = smooth_bg.convert(), ray_surf.convert_alpha()
+        _ocean_backdrop['gradient'], _ocean_backdrop['ray'] = smooth_bg, ray_surf
+    return _ocean_backdrop['gradient'], _ocean_backdrop['ray']
+
+def draw_ocean_background(surface, time_offset=0):
+    """Smooth ocean gradient tanpa garis-garis + subtle animation"""
+    gradient, ray_surf = _get_ocean_backdrop()
+    surface.blit(gradient, (0, 0))
+
+    # Light rays (dipertahankan tapi lebih halus) - hanya offset yang dihitung per frame
+    surface.blits([(ray_surf, ((SCREEN_WIDTH // 5) * i + int(20 * math.sin(time_offset * 0.2 + i)), 0))
+                   for i in range(5)], doreturn=False)
 
     # Floating particles tetap
     for i in range(15):
@@ -64,8 +77,9 @@ def draw_swimming_fish(surface, x, y, size, direction, color, t):
     eye_x = x + size//2 if direction > 0 else x - size//2
     pygame.draw.circle(surface, C_DARK_BG, (eye_x, y - 2), 3)
 
-def draw_glass_panel(surface, rect, color=C_PANEL_BG, alpha=200, border_color=None, glow=False, radius=12):
-    """Modern glass panel without heavy borders"""
+_glass_panels = LRUCache(GLASS_PANEL_CACHE_SIZE)  # (size, color, alpha, border, glow, radius) -> (panel, glow)
+
+def _render_glass_panel(rect, color, alpha, border_color, glow, radius):
     s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
     pygame.draw.rect(s, (*color, alpha), s.get_rect(), border_radius=radius)
     
@@ -79,12 +93,28 @@ def draw_glass_panel(surface, rect, color=C_PANEL_BG, alpha=200, border_color=No
         pygame.draw.rect(s, (*border_color, 100), s.get_rect(), 1, border_radius=radius)
     
     # Subtle glow
+    glow_surf = None
     if glow:
         glow_surf = pygame.Surface((rect.width+10, rect.height+10), pygame.SRCALPHA)
         pygame.draw.rect(glow_surf, (*C_ACCENT, 20), glow_surf.get_rect(), border_radius=radius+2)
-        surface.blit(glow_surf, (rect.x-5, rect.y-5))
+    return s, glow_surf
+
+def draw_glass_panel(surface, rect, color=C_PANEL_BG, alpha=200, border_color=None, glow=False, radius=12):
+    """Modern glass panel without heavy borders (surface di-cache per ukuran + style). Return rect yang digambar"""
+    rect = pygame.Rect(rect)
+    key = (rect.size, tuple(color), alpha, tuple(border_color) if border_color else None, bool(glow), radius)
+    cached = _glass_panels.get(key)
+    if cached is None:
+        cached = _render_glass_panel(rect, color, alpha, border_color, glow, radius)
+        _glass_panels.put(key, cached)
+    panel, glow_surf = cached
     
-    surface.blit(s, rect)
+    if glow_surf is not None:
+        surface.blit(glow_surf, (rect.x-5, rect.y-5))
+        surface.blit(panel, rect)
+        return rect.inflate(10, 10)
+    surface.blit(panel, rect)
+    return rect
 
 def draw_wave_bar(surface, x, y, w, h, progress, color=C_SUCCESS):
     """Smooth progress bar"""
@@ -100,21 +130,20 @@ def draw_wave_bar(surface, x, y, w, h, progress, color=C_SUCCESS):
 
 # --- HUD ---
 def draw_hud(surface, player):
-    """Clean modern HUD"""
+    """Clean modern HUD. Return list rect yang digambar"""
     
     # Score Card
-    score_font = pygame.font.Font(None, 56)
-    score_s = score_font.render(f"{player.score}", True, C_HIGHLIGHT)
+    score_s = assets.render_text(f"{player.score}", 56, C_HIGHLIGHT)
     card_w = max(score_s.get_width() + 70, 150)
     card_rect = pygame.Rect(PAD, PAD, card_w, 70)
-    draw_glass_panel(surface, card_rect, glow=(player.combo_count >= 5))
+    rects = [draw_glass_panel(surface, card_rect, glow=(player.combo_count >= 5))]
     
     # Score with shadow
-    surface.blit(score_font.render(f"{player.score}", True, (0,0,0,80)), (card_rect.x + 17, card_rect.y + 10))
+    surface.blit(assets.render_text(f"{player.score}", 56, (0,0,0,80)), (card_rect.x + 17, card_rect.y + 10))
     surface.blit(score_s, (card_rect.x + 15, card_rect.y + 8))
     
     # Level badge
-    lvl_s = pygame.font.Font(None, 30).render(f"{player.level}", True, C_ACCENT)
+    lvl_s = assets.render_text(f"{player.level}", 30, C_ACCENT)
     bubble_x, bubble_y = card_rect.right - 35, card_rect.centery
     pygame.draw.circle(surface, (*C_ACCENT, 30), (bubble_x, bubble_y), 20)
     pygame.draw.circle(surface, C_PANEL_BG, (bubble_x, bubble_y), 18)
@@ -122,12 +151,12 @@ def draw_hud(surface, player):
     surface.blit(lvl_s, lvl_s.get_rect(center=(bubble_x, bubble_y)))
     
     # Label
-    surface.blit(pygame.font.Font(None, 18).render("SCORE", True, C_TEXT_SUB), (card_rect.x + 15, card_rect.bottom - 20))
+    surface.blit(assets.render_text("SCORE", 18, C_TEXT_SUB), (card_rect.x + 15, card_rect.bottom - 20))
 
     # Health Bubbles
     health_w = player.health * 30 + 40
     health_rect = pygame.Rect(SCREEN_WIDTH - health_w - PAD, PAD, health_w, 55)
-    draw_glass_panel(surface, health_rect)
+    rects.append(draw_glass_panel(surface, health_rect))
     
     for i in range(player.health):
         bx, by = health_rect.left + 25 + i * 30, health_rect.centery
@@ -141,7 +170,7 @@ def draw_hud(surface, player):
     bar_color, status_txt = C_ACCENT, "BUILDING POWER..."
     
     if hasattr(player, 'combo_active') and player.combo_active:
-        prog = (player.combo_timer - pygame.time.get_ticks()) / player.combo_duration
+        prog = (player.combo_timer - get_ticks()) / player.combo_duration
         bar_color, status_txt = C_HIGHLIGHT, "★ FEEDING FRENZY ★"
     elif hasattr(player, 'combo_count'):
         prog = min(player.combo_count / 10, 1.0)
@@ -149,39 +178,42 @@ def draw_hud(surface, player):
         status_txt = "⚡ ULTIMATE READY ⚡" if prog >= 1.0 else f"COMBO: {player.combo_count}/10"
     
     container = pygame.Rect(bar_x - 15, bar_y - 22, bar_w + 30, 52)
-    draw_glass_panel(surface, container, alpha=190, glow=(prog >= 1.0))
+    rects.append(draw_glass_panel(surface, container, alpha=190, glow=(prog >= 1.0)))
     draw_wave_bar(surface, bar_x, bar_y, bar_w, bar_h, prog, bar_color)
     
     # Status text
-    status_font = pygame.font.Font(None, 20)
     txt_center = (bar_x + bar_w//2, bar_y + 24)
-    surface.blit(status_font.render(status_txt, True, (0,0,0,100)), status_font.render(status_txt, True, bar_color).get_rect(center=(txt_center[0]+1, txt_center[1]+1)))
-    surface.blit(status_font.render(status_txt, True, bar_color), status_font.render(status_txt, True, bar_color).get_rect(center=txt_center))
+    status_s = assets.render_text(status_txt, 20, bar_color)
+    surface.blit(assets.render_text(status_txt, 20, (0,0,0,100)), status_s.get_rect(center=(txt_center[0]+1, txt_center[1]+1)))
+    rects.append(surface.blit(status_s, status_s.get_rect(center=txt_center)).inflate(2, 2))
+    return rects
 
 # --- LOADING SCREEN ---
 class LoadingScreen:
     def __init__(self):
         self.active, self.progress, self.ripples = True, 0.0, []
         
-    def update(self):
-        self.progress += 1.2
-        if random.random() < 0.1:
+    def update(self, dt):
+        """Maju `dt` ms (kecepatan sama di frame rate berapa pun, acuan 60 FPS)"""
+        step = dt / (1000 / 60)
+        self.progress += 1.2 * step
+        if random.random() < 0.1 * step:
             self.ripples.append({'x': SCREEN_WIDTH//2 + random.randint(-150, 150), 'y': SCREEN_HEIGHT//2 + random.randint(-100, 100), 'r': 0, 'alpha': 120})
         for ripple in self.ripples[:]:
-            ripple['r'] += 2
-            ripple['alpha'] -= 3
+            ripple['r'] += 2 * step
+            ripple['alpha'] -= 3 * step
             if ripple['alpha'] <= 0: self.ripples.remove(ripple)
         if self.progress >= 100: self.active = False
         return self.active
     
     def draw(self, surface):
-        t = pygame.time.get_ticks() * 0.003
+        t = get_ticks() * 0.003
         draw_ocean_background(surface, t)
         cx, cy = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
         
         # Subtle ripples
         for ripple in self.ripples:
-            pygame.draw.circle(surface, (*C_ACCENT, ripple['alpha']), (int(ripple['x']), int(ripple['y'])), int(ripple['r']), 1)
+            pygame.draw.circle(surface, (*C_ACCENT, int(ripple['alpha'])), (int(ripple['x']), int(ripple['y'])), int(ripple['r']), 1)
         
         # Fish icon
         fish_y = cy
@@ -207,11 +239,11 @@ class LoadingScreen:
             surface.blit(shine, (bar_x, bar_y))
         
         # Percentage
-        pct_s = pygame.font.Font(None, 40).render(f"{int(self.progress)}%", True, C_TEXT_MAIN)
+        pct_s = assets.render_text(f"{int(self.progress)}%", 40, C_TEXT_MAIN)
         surface.blit(pct_s, pct_s.get_rect(center=(cx, bar_y + 40)))
         
         # Title - clean no wave
-        title_s = pygame.font.Font(None, 72).render("FEEDING FRENZY", True, C_ACCENT)
+        title_s = assets.render_text("FEEDING FRENZY", 72, C_ACCENT)
         surface.blit(title_s, title_s.get_rect(center=(cx, cy - 120)))
 
 # --- WELCOME SCREEN ---
@@ -240,7 +272,7 @@ class WelcomeScreen:
         self.active = False
     
     def draw(self, surface):
-        t = pygame.time.get_ticks() * 0.003
+        t = get_ticks() * 0.003
         draw_ocean_background(surface, t)
         
         # Background fish (subtle)
@@ -253,11 +285,11 @@ class WelcomeScreen:
         draw_glass_panel(surface, card_rect, alpha=230, glow=True)
         
         # Title - clean
-        title_s = pygame.font.Font(None, 64).render("FEEDING FRENZY", True, C_ACCENT)
+        title_s = assets.render_text("FEEDING FRENZY", 64, C_ACCENT)
         surface.blit(title_s, title_s.get_rect(center=(cx, card_rect.top + 60)))
         
         # Subtitle
-        sub_s = pygame.font.Font(None, 26).render("Ocean Evolution", True, C_TEXT_SUB)
+        sub_s = assets.render_text("Ocean Evolution", 26, C_TEXT_SUB)
         surface.blit(sub_s, sub_s.get_rect(center=(cx, card_rect.top + 105)))
         
         # Divider
@@ -274,31 +306,32 @@ class WelcomeScreen:
             y_pos = card_rect.top + 160 + i * 50
             inst_rect = pygame.Rect(cx - 180, y_pos, 360, 40)
             draw_glass_panel(surface, inst_rect, alpha=120)
-            surface.blit(pygame.font.Font(None, 28).render(icon, True, C_ACCENT), (inst_rect.left + 20, y_pos + 8))
-            surface.blit(pygame.font.Font(None, 24).render(txt, True, C_TEXT_MAIN), (inst_rect.left + 60, y_pos + 10))
+            surface.blit(assets.render_text(icon, 28, C_ACCENT), (inst_rect.left + 20, y_pos + 8))
+            surface.blit(assets.render_text(txt, 24, C_TEXT_MAIN), (inst_rect.left + 60, y_pos + 10))
         
         # Prompt
-        if (pygame.time.get_ticks() // 500) % 2:
-            prompt_s = pygame.font.Font(None, 28).render("PRESS ANY KEY TO START", True, C_HIGHLIGHT)
+        if (get_ticks() // 500) % 2:
+            prompt_s = assets.render_text("PRESS ANY KEY TO START", 28, C_HIGHLIGHT)
             surface.blit(prompt_s, prompt_s.get_rect(center=(cx, card_rect.bottom - 50)))
 
 # --- OTHER UI ---
 class Notification:
     def __init__(self, text, color=C_TEXT_MAIN, duration=2000, size='normal'):
-        self.text, self.color, self.duration, self.spawn_time, self.y_offset = text, color, duration, pygame.time.get_ticks(), 0
+        self.text, self.color, self.duration, self.spawn_time, self.y_offset = text, color, duration, get_ticks(), 0
         
     def update(self):
-        elapsed = pygame.time.get_ticks() - self.spawn_time
+        elapsed = get_ticks() - self.spawn_time
         if elapsed > self.duration: return False
         self.y_offset = min(20, elapsed * 0.1)
         return True
     
     def draw(self, surface):
-        txt_s = pygame.font.Font(None, 32).render(self.text, True, self.color)
+        txt_s = assets.render_text(self.text, 32, self.color)
         rect = pygame.Rect(0, 0, txt_s.get_width() + 40, txt_s.get_height() + 20)
         rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 - self.y_offset)
-        draw_glass_panel(surface, rect, alpha=220)
+        rect = draw_glass_panel(surface, rect, alpha=220)
         surface.blit(txt_s, txt_s.get_rect(center=rect.center))
+        return rect
 
 class PauseMenu:
     def __init__(self):
@@ -318,12 +351,14 @@ class PauseMenu:
         surface.blit(overlay, (0, 0))
         rect = pygame.Rect((SCREEN_WIDTH - 280)//2, (SCREEN_HEIGHT - 300)//2, 280, 300)
         draw_glass_panel(surface, rect, glow=True)
-        surface.blit(pygame.font.Font(None, 48).render("PAUSED", True, C_ACCENT), pygame.font.Font(None, 48).render("PAUSED", True, C_ACCENT).get_rect(center=(rect.centerx, rect.top + 50)))
+        title_s = assets.render_text("PAUSED", 48, C_ACCENT)
+        surface.blit(title_s, title_s.get_rect(center=(rect.centerx, rect.top + 50)))
         for i, opt in enumerate(self.options):
             y = rect.top + 120 + i * 60
             if i == self.selected:
                 pygame.draw.circle(surface, C_HIGHLIGHT, (rect.centerx - 90, y + 8), 4)
-            surface.blit(pygame.font.Font(None, 32).render(opt, True, C_HIGHLIGHT if i == self.selected else C_TEXT_SUB), pygame.font.Font(None, 32).render(opt, True, C_HIGHLIGHT if i == self.selected else C_TEXT_SUB).get_rect(center=(rect.centerx, y + 8)))
+            opt_s = assets.render_text(opt, 32, C_HIGHLIGHT if i == self.selected else C_TEXT_SUB)
+            surface.blit(opt_s, opt_s.get_rect(center=(rect.centerx, y + 8)))
 
 class Tutorial:
     def __init__(self):
@@ -331,19 +366,20 @@ class Tutorial:
     def show_next_tip(self):
         if self.current_tip < len(self.tips):
             self.shown_tips.add(self.current_tip)
-            self.start_time = pygame.time.get_ticks()
+            self.start_time = get_ticks()
             self.current_tip += 1
             return True
         return False
     def update(self):
-        return not (self.current_tip > 0 and self.current_tip <= len(self.tips) and pygame.time.get_ticks() - self.start_time > self.display_time)
+        return not (self.current_tip > 0 and self.current_tip <= len(self.tips) and get_ticks() - self.start_time > self.display_time)
     def draw(self, surface):
         if 0 < self.current_tip <= len(self.tips):
-            txt_s = pygame.font.Font(None, 26).render(self.tips[self.current_tip - 1], True, C_TEXT_MAIN)
+            txt_s = assets.render_text(self.tips[self.current_tip - 1], 26, C_TEXT_MAIN)
             rect = pygame.Rect(0, 0, txt_s.get_width() + 60, txt_s.get_height() + 20)
             rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
-            draw_glass_panel(surface, rect, alpha=200)
+            rect = draw_glass_panel(surface, rect, alpha=200)
             surface.blit(txt_s, txt_s.get_rect(center=rect.center))
+            return rect
 
 def draw_end_game_screen(surface, title, title_color, player, is_win=False):
     overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -352,23 +388,57 @@ def draw_end_game_screen(surface, title, title_color, player, is_win=False):
     surface.blit(overlay, (0, 0))
     card_rect = pygame.Rect((SCREEN_WIDTH - 420)//2, (SCREEN_HEIGHT - 360)//2, 420, 360)
     draw_glass_panel(surface, card_rect, glow=True)
-    surface.blit(pygame.font.Font(None, 56).render(title, True, title_color), pygame.font.Font(None, 56).render(title, True, title_color).get_rect(center=(card_rect.centerx, card_rect.top + 60)))
+    title_s = assets.render_text(title, 56, title_color)
+    surface.blit(title_s, title_s.get_rect(center=(card_rect.centerx, card_rect.top + 60)))
     stats = [("Final Score", player.score, C_HIGHLIGHT), ("Fish Eaten", player.fish_eaten, C_ACCENT), ("Max Combo", f"{player.max_combo}x", C_TEXT_MAIN)]
     for i, (label, value, col) in enumerate(stats):
         y = card_rect.top + 140 + i * 45
-        surface.blit(pygame.font.Font(None, 30).render(label, True, C_TEXT_SUB), (card_rect.left + 60, y))
-        surface.blit(pygame.font.Font(None, 30).render(str(value), True, col), pygame.font.Font(None, 30).render(str(value), True, col).get_rect(midright=(card_rect.right - 60, y + 5)))
-    if (pygame.time.get_ticks() // 700) % 2:
-        surface.blit(pygame.font.Font(None, 30).render("PRESS 'R' TO RESTART", True, C_ACCENT), pygame.font.Font(None, 30).render("PRESS 'R' TO RESTART", True, C_ACCENT).get_rect(center=(card_rect.centerx, card_rect.bottom - 50)))
+        surface.blit(assets.render_text(label, 30, C_TEXT_SUB), (card_rect.left + 60, y))
+        value_s = assets.render_text(str(value), 30, col)
+        surface.blit(value_s, value_s.get_rect(midright=(card_rect.right - 60, y + 5)))
+    if (get_ticks() // 700) % 2:
+        prompt_s = assets.render_text("PRESS 'R' TO RESTART", 30, C_ACCENT)
+        surface.blit(prompt_s, prompt_s.get_rect(center=(card_rect.centerx, card_rect.bottom - 50)))
+
+# --- LEVEL BADGES ---
+# Jenis badge -> warna; ukuran (radius, offset, font_size) beda untuk player
+BADGE_COLORS = {'player': C_ACCENT, 'prey': C_SUCCESS, 'equal': C_HIGHLIGHT, 'predator': C_DANGER, 'neutral': C_TEXT_MAIN}
+_level_badges = {}  # (level, kind) -> (Surface, offset)
+
+def _render_level_badge(level, kind):
+    radius, offset, font_size = (22, 45, 24) if kind == 'player' else (16, 35, 20)
+    color = BADGE_COLORS[kind]
+    size = (radius + 2) * 2
+    badge = pygame.Surface((size, size), pygame.SRCALPHA)
+    c = (size // 2, size // 2)
+    pygame.draw.circle(badge, (*color, 40), c, radius + 2)
+    pygame.draw.circle(badge, C_DARK_BG, c, radius)
+    pygame.draw.circle(badge, color, c, radius, 1)
+    level_s = assets.render_text(str(level), font_size, color)
+    badge.blit(level_s, level_s.get_rect(center=c))
+    return badge, offset
+
+def build_level_badges():
+    """Pre-render atlas badge level 1..MAX_LEVEL untuk semua jenis (panggil setelah load_assets)"""
+    for level in range(1, MAX_LEVEL + 1):
+        for kind in BADGE_COLORS:
+            _level_badges[(level, kind)] = _render_level_badge(level, kind)
 
 def draw_level_indicator(surface, level, x, y, is_player=False, player_level=None):
-    radius, offset, font_size = (22, 45, 24) if is_player else (16, 35, 20)
-    color = C_ACCENT if is_player else (C_SUCCESS if level < player_level else C_HIGHLIGHT if level == player_level else C_DANGER) if player_level else C_TEXT_MAIN
-    cx, cy = int(x), int(y - offset)
-    pygame.draw.circle(surface, (*color, 40), (cx, cy), radius + 2)
-    pygame.draw.circle(surface, C_DARK_BG, (cx, cy), radius)
-    pygame.draw.circle(surface, color, (cx, cy), radius, 1)
-    surface.blit(pygame.font.Font(None, font_size).render(str(level), True, color), pygame.font.Font(None, font_size).render(str(level), True, color).get_rect(center=(cx, cy)))
+    if is_player:
+        kind = 'player'
+    elif player_level:
+        kind = 'prey' if level < player_level else 'equal' if level == player_level else 'predator'
+    else:
+        kind = 'neutral'
+    key = (level, kind)
+    if key not in _level_badges:
+        _level_badges[key] = _render_level_badge(level, kind)
+    badge, offset = _level_badges[key]
+    rect = badge.get_rect(center=(int(x), int(y - offset)))
+    if not rect.colliderect(surface.get_rect()):
+        return None  # Ikan di luar layar
+    return surface.blit(badge, rect)
 
 def draw_progress_bar(surface, x, y, width, height, progress, bg_color=(40, 50, 60), fill_color=C_SUCCESS):
     x, y, width, height, progress = int(x), int(y), int(width), int(height), max(0.0, min(1.0, float(progress)))
@@ -382,6 +452,6 @@ def draw_progress_bar(surface, x, y, width, height, progress, bg_color=(40, 50,
 
 draw_modern_card = draw_glass_panel
 
-__all__ = ['draw_hud', 'draw_level_indicator', 'draw_progress_bar', 'draw_glass_panel', 'draw_modern_card', 'draw_end_game_screen', 
+__all__ = ['draw_hud', 'draw_level_indicator', 'build_level_badges', 'draw_progress_bar', 'draw_glass_panel', 'draw_modern_card', 'draw_end_game_screen', 
            'LoadingScreen', 'Notification', 'PauseMenu', 'WelcomeScreen', 'Tutorial', 
            'C_ACCENT', 'C_HIGHLIGHT', 'C_DARK_BG', 'C_TEXT_MAIN', 'C_DANGER', 'C_SUCCESS', 'C_PANEL_BG', 'C_TEXT_SUB']
\ No newline at end of file
@@ -2,47 +2,64 @@ import json
 import os
 import random
 import math
+import numpy as np
 import pygame
 from datetime import datetime
-from .config import SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LEVEL, ACHIEVEMENTS, DAILY_CHALLENGES
+from .assets import assets
+from .cache import LRUCache
+from .clock import get_ticks
+from .config import (SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LEVEL, ACHIEVEMENTS, DAILY_CHALLENGES, CACHE_DIR,
+                     LIGHT_RAY_WIDTH_STEP, BUBBLE_ALPHA_STEP)
 
 # Score Popup - angka muncul saat makan ikan
 class ScorePopup:
     def __init__(self, x, y, score, color=(255, 255, 100)):
+        self.score = self.color = None
+        self.reset(x, y, score, color)
+
+    def reset(self, x, y, score, color=(255, 255, 100)):
+        """Inisialisasi ulang (dipakai juga oleh ObjectPool)"""
         self.x = x
         self.y = y
+        self.spawn_time = get_ticks()
+        self.lifetime = 1000
+        # Copy dari cache karena set_alpha per popup akan mengubah surface-nya.
+        # Instance dari pool memakai ulang copy-nya kalau score + warna sama
+        if (score, color) != (self.score, self.color):
+            self.text = assets.render_text(f"+{score}", 36, color).copy()
+            self.outline = assets.render_text(f"+{score}", 36, (0, 0, 0)).copy()
         self.score = score
         self.color = color
-        self.spawn_time = pygame.time.get_ticks()
-        self.lifetime = 1000
-        self.font = pygame.font.Font(None, 36)
         
     def update(self):
-        elapsed = pygame.time.get_ticks() - self.spawn_time
+        elapsed = get_ticks() - self.spawn_time
         if elapsed > self.lifetime:
             return False
         self.y -= 1  # Float up
         return True
     
     def draw(self, surface):
-        elapsed = pygame.time.get_ticks() - self.spawn_time
+        elapsed = get_ticks() - self.spawn_time
         alpha = int(255 * (1 - elapsed / self.lifetime))
         
         # Draw score with outline
-        text = self.font.render(f"+{self.score}", True, self.color)
+        text = self.text
         text.set_alpha(alpha)
         
         # Outline
-        outline = self.font.render(f"+{self.score}", True, (0, 0, 0))
+        outline = self.outline
         outline.set_alpha(alpha)
         
         for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
             surface.blit(outline, (self.x + dx - text.get_width()//2, self.y + dy))
-        surface.blit(text, (self.x - text.get_width()//2, self.y))
+        rect = surface.blit(text, (self.x - text.get_width()//2, self.y))
+        return rect.inflate(4, 4)
 
 
 # Bubble effect - gelembung yang naik
 class Bubble:
+    _sprites = {}  # (size, alpha) -> Surface, di-share semua bubble
+
     def __init__(self):
         self.reset()
         self.y = random.randint(0, SCREEN_HEIGHT)  # Start anywhere first time
@@ -55,6 +72,7 @@ class Bubble:
         self.wobble_phase = random.uniform(0, math.pi * 2)
         self.wobble_speed = random.uniform(0.02, 0.05)
         self.alpha = random.randint(50, 150)
+        self.sprite = self.get_sprite(self.size, self.alpha)
         
     def update(self):
         self.y -= self.speed
@@ -64,14 +82,31 @@ class Bubble:
         if self.y < -20:
             self.reset()
             
+    @classmethod
+    def get_sprite(cls, size, alpha):
+        """Sprite bubble dari cache, alpha dikuantisasi ke BUBBLE_ALPHA_STEP"""
+        alpha = alpha - alpha % BUBBLE_ALPHA_STEP
+        key = (size, alpha)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (200, 230, 255, alpha), (size, size), size, 1)
+            # Highlight
+            pygame.draw.circle(sprite, (255, 255, 255, alpha // 2),
+                              (size - size//3, size - size//3), size // 3)
+            cls._sprites[key] = sprite
+        return sprite
+
+    def blit_args(self):
+        return self.sprite, (int(self.x - self.size), int(self.y - self.size))
+
     def draw(self, surface):
-        bubble_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(bubble_surface, (200, 230, 255, self.alpha), 
-                          (self.size, self.size), self.size, 1)
-        # Highlight
-        pygame.draw.circle(bubble_surface, (255, 255, 255, self.alpha // 2),
-                          (self.size - self.size//3, self.size - self.size//3), self.size // 3)
-        surface.blit(bubble_surface, (int(self.x - self.size), int(self.y - self.size)))
+        surface.blit(*self.blit_args())
+
+
+def draw_bubbles(surface, bubbles):
+    """Gambar semua bubble dalam satu batch Surface.blits, return list rect yang digambar"""
+    return surface.blits([bubble.blit_args() for bubble in bubbles])
 
 
 # Water current effect
@@ -85,7 +120,7 @@ class WaterCurrent:
         self.particles = []
         
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
         # Randomly change current every 10-20 seconds
         if current_time - self.change_timer > random.randint(10000, 20000):
@@ -115,7 +150,7 @@ class WaterCurrent:
             # Draw current lines
             alpha = int(min(100, self.strength * 40))
             for i in range(5):
-                y = (pygame.time.get_ticks() // 20 + i * 150) % SCREEN_HEIGHT
+                y = (get_ticks() // 20 + i * 150) % SCREEN_HEIGHT
                 start_x = 0 if self.direction == 1 else SCREEN_WIDTH
                 end_x = SCREEN_WIDTH if self.direction == 1 else 0
                 
@@ -126,21 +161,61 @@ class WaterCurrent:
 
 # Vignette effect untuk atmosfer
 class VignetteEffect:
-    def __init__(self):
-        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self._create_vignette()
-        
+    """Overlay gelap di pinggir layar.
+
+    Alpha dihitung sekali secara vectorized (NumPy) lalu di-cache ke disk
+    per resolusi + parameter, jadi launch berikutnya tinggal load PNG.
+    """
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, color=(0, 20, 40), max_alpha=80, start=0.6):
+        self.size = (width, height)
+        self.color = color
+        self.max_alpha = max_alpha
+        self.start = start
+        self.surface = self._load_cached()
+        if self.surface is None:
+            self.surface = self._create_vignette()
+            self._save_cache()
+
+    def _cache_path(self):
+        width, height = self.size
+        color = '-'.join(str(c) for c in self.color)
+        return os.path.join(CACHE_DIR, f"vignette_{width}x{height}_{color}_{self.max_alpha}_{self.start}.png")
+
+    def _load_cached(self):
+        path = self._cache_path()
+        if not os.path.exists(path):
+            return None
+        try:
+            surface = pygame.image.load(path)
+            if surface.get_size() != self.size:
+                return None
+            return surface.convert_alpha() if pygame.display.get_surface() else surface
+        except Exception as e:
+            print(f"Error loading vignette cache: {e}")
+            return None
+
+    def _save_cache(self):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            pygame.image.save(self.surface, self._cache_path())
+        except Exception as e:
+            print(f"Error saving vignette cache: {e}")
+
     def _create_vignette(self):
-        center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        width, height = self.size
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface.fill((*self.color, 0))
+
+        center_x, center_y = width // 2, height // 2
         max_dist = math.hypot(center_x, center_y)
-        
-        for y in range(SCREEN_HEIGHT):
-            for x in range(SCREEN_WIDTH):
-                dist = math.hypot(x - center_x, y - center_y)
-                # Only darken edges
-                if dist > max_dist * 0.6:
-                    alpha = int(min(80, (dist - max_dist * 0.6) / (max_dist * 0.4) * 80))
-                    self.surface.set_at((x, y), (0, 20, 40, alpha))
+        # Array berbentuk (width, height) mengikuti urutan sumbu surfarray
+        dist = np.hypot(np.arange(width)[:, None] - center_x, np.arange(height)[None, :] - center_y)
+        # Only darken edges
+        ramp = (dist - max_dist * self.start) / (max_dist * (1 - self.start)) * self.max_alpha
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = np.clip(ramp, 0, self.max_alpha).astype(np.uint8)
+        del alpha  # lepas lock surface
+        return surface
     
     def draw(self, surface):
         surface.blit(self.surface, (0, 0))
@@ -148,7 +223,8 @@ class VignetteEffect:
 
 # Daily Challenge System
 class DailyChallengeManager:
-    def __init__(self):
+    def __init__(self, persistent=True):
+        self.persistent = persistent  # False: tidak menulis daily_challenge.json (simulasi headless)
         self.today = datetime.now().strftime('%Y-%m-%d')
         self.current_challenge = None
         self.progress = 0
@@ -179,6 +255,8 @@ class DailyChallengeManager:
         self.save()
     
     def save(self):
+        if not self.persistent:
+            return
         try:
             with open('daily_challenge.json', 'w') as f:
                 json.dump({
@@ -220,6 +298,7 @@ class DailyChallengeManager:
         return 0
     
     def draw(self, surface, y_offset=10):
+        """Return rect area yang digambar (None kalau tidak ada challenge)"""
         if not self.current_challenge:
             return
         
@@ -234,17 +313,16 @@ class DailyChallengeManager:
         box_y = y_offset
         
         # Background
-        box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        color = (0, 100, 0, 180) if self.completed else (0, 0, 0, 150)
-        pygame.draw.rect(box_surface, color, (0, 0, box_width, box_height), border_radius=8)
-        border_color = (0, 255, 0) if self.completed else (255, 215, 0)
-        pygame.draw.rect(box_surface, border_color, (0, 0, box_width, box_height), 2, border_radius=8)
-        surface.blit(box_surface, (box_x, box_y))
+        key = (box_width, box_height, self.completed)
+        box_surface = _challenge_panels.get(key)
+        if box_surface is None:
+            box_surface = _render_challenge_panel(box_width, box_height, self.completed)
+            _challenge_panels.put(key, box_surface)
+        rect = surface.blit(box_surface, (box_x, box_y))
         
         # Title
-        font_title = pygame.font.Font(None, 22)
-        title_text = font_title.render(f"Daily: {challenge['name']}", True, (255, 215, 0))
-        surface.blit(title_text, (box_x + 10, box_y + 8))
+        title_text = assets.render_text(f"Daily: {challenge['name']}", 22, (255, 215, 0))
+        rect.union_ip(surface.blit(title_text, (box_x + 10, box_y + 8)))
         
         # Progress bar
         bar_width = box_width - 20
@@ -252,49 +330,119 @@ class DailyChallengeManager:
         bar_x = box_x + 10
         bar_y = box_y + 32
         
-        pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+        rect.union_ip(pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height)))
         progress_pct = min(1.0, self.progress / challenge['target'])
         if progress_pct > 0:
             pygame.draw.rect(surface, (0, 255, 100), (bar_x, bar_y, int(bar_width * progress_pct), bar_height))
         pygame.draw.rect(surface, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
         
         # Progress text
-        font_prog = pygame.font.Font(None, 18)
         status = "Complete!" if self.completed else f"{self.progress}/{challenge['target']}"
-        prog_text = font_prog.render(status, True, (255, 255, 255))
-        surface.blit(prog_text, (bar_x + bar_width // 2 - prog_text.get_width() // 2, bar_y + 16))
+        prog_text = assets.render_text(status, 18, (255, 255, 255))
+        # Teks progress keluar dari bawah box: ikut masuk dirty rect supaya tidak meninggalkan jejak
+        rect.union_ip(surface.blit(prog_text, (bar_x + bar_width // 2 - prog_text.get_width() // 2, bar_y + 16)))
+        return rect
+
+
+_challenge_panels = LRUCache(4)  # (width, height, completed) -> panel
+
+
+def _render_challenge_panel(width, height, completed):
+    box_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    color = (0, 100, 0, 180) if completed else (0, 0, 0, 150)
+    pygame.draw.rect(box_surface, color, (0, 0, width, height), border_radius=8)
+    border_color = (0, 255, 0) if completed else (255, 215, 0)
+    pygame.draw.rect(box_surface, border_color, (0, 0, width, height), 2, border_radius=8)
+    return box_surface
 
 
 # Light ray effect (biar ada ambiencenya coy)
+LIGHT_RAY_COLOR = (255, 255, 200)
+
+
+def _light_ray_alpha(width, peak):
+    """Alpha gradient satu ray sebagai array (width, SCREEN_HEIGHT): melebar ke bawah, memudar ke bawah"""
+    rows = np.arange(SCREEN_HEIGHT)
+    fade = peak * (1 - rows / SCREEN_HEIGHT) * 0.7
+    half = (width * (0.3 + 0.7 * rows / SCREEN_HEIGHT)).astype(int) // 2
+    inside = np.abs(np.arange(width)[:, None] - width // 2) <= half[None, :]
+    return np.where(inside, fade[None, :], 0.0)
+
+
+def _alpha_surface(alpha, color=LIGHT_RAY_COLOR):
+    surface = pygame.Surface(alpha.shape, pygame.SRCALPHA)
+    surface.fill((*color, 0))
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[:] = alpha.astype(np.uint8)
+    del pixels
+    return surface
+
+
 class LightRay:
+    """Satu ray cahaya. Gradient dirender sekali per width bucket lalu di-share,
+    intensitas per ray diatur lewat surface alpha saat blit."""
+    _gradients = {}
+
     def __init__(self):
         self.x = random.randint(0, SCREEN_WIDTH)
         self.width = random.randint(20, 80)
         self.alpha = random.randint(10, 30)
         self.speed = random.uniform(0.1, 0.3)
         self.angle = random.uniform(-0.2, 0.2)
-        
+        self.image = self.get_gradient(self.width)
+
+    @classmethod
+    def get_gradient(cls, width):
+        bucket = max(LIGHT_RAY_WIDTH_STEP, round(width / LIGHT_RAY_WIDTH_STEP) * LIGHT_RAY_WIDTH_STEP)
+        if bucket not in cls._gradients:
+            cls._gradients[bucket] = _alpha_surface(_light_ray_alpha(bucket, 255))
+        return cls._gradients[bucket]
+
     def update(self):
         self.x += self.speed
         if self.x > SCREEN_WIDTH + 100:
             self.x = -100
             self.width = random.randint(20, 80)
+            self.image = self.get_gradient(self.width)
             
     def draw(self, surface):
-        # Create gradient light ray
-        ray_surface = pygame.Surface((self.width, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for i in range(SCREEN_HEIGHT):
-            alpha = int(self.alpha * (1 - i / SCREEN_HEIGHT) * 0.7)
-            width_at_y = int(self.width * (0.3 + 0.7 * i / SCREEN_HEIGHT))
-            pygame.draw.line(ray_surface, (255, 255, 200, alpha), 
-                           (self.width//2 - width_at_y//2, i),
-                           (self.width//2 + width_at_y//2, i))
-        surface.blit(ray_surface, (int(self.x), 0))
+        self.image.set_alpha(self.alpha)
+        surface.blit(self.image, (int(self.x), 0))
+
+
+class LightRayLayer:
+    """Semua ray di-bake ke satu layer yang di-scroll (satu blit per frame, wrap-around).
+
+    Interface update()/draw() sama dengan LightRay, jadi bisa dipakai di list yang sama.
+    """
+    def __init__(self, count=5, speed=0.2):
+        self.period = SCREEN_WIDTH + 200  # Rentang x ray: -100 .. SCREEN_WIDTH + 100
+        self.speed = speed
+        self.offset = 0.0
+
+        # Gabungkan alpha semua ray (operator 'over' untuk warna yang sama)
+        coverage = np.zeros((self.period, SCREEN_HEIGHT))
+        for _ in range(count):
+            width = random.randint(20, 80)
+            ray = _light_ray_alpha(width, random.randint(10, 30)) / 255
+            x = random.randint(0, self.period - 1)
+            cols = (np.arange(width) + x) % self.period
+            coverage[cols] = 1 - (1 - coverage[cols]) * (1 - ray)
+        self.image = _alpha_surface(coverage * 255)
+
+    def update(self):
+        self.offset = (self.offset + self.speed) % self.period
+
+    def draw(self, surface):
+        x = int(self.offset) - 100
+        surface.blit(self.image, (x, 0))
+        surface.blit(self.image, (x - self.period, 0))
 
 
 # Achievement System
 class AchievementManager:
-    def __init__(self):
+    def __init__(self, persistent=True):
+        self.persistent = persistent  # False: tidak menulis achievements.json (simulasi headless)
         self.unlocked = set()
         self.pending_notifications = []
         self.load()
@@ -309,6 +457,8 @@ class AchievementManager:
             self.unlocked = set()
     
     def save(self):
+        if not self.persistent:
+            return
         try:
             with open('achievements.json', 'w') as f:
                 json.dump({'unlocked': list(self.unlocked)}, f)
@@ -323,7 +473,7 @@ class AchievementManager:
                 'name': achievement['name'],
                 'desc': achievement['desc'],
                 'icon': achievement['icon'],
-                'time': pygame.time.get_ticks()
+                'time': get_ticks()
             })
             self.save()
             return True
@@ -359,8 +509,10 @@ class AchievementManager:
             self.unlock('apex_predator')
     
     def draw_notifications(self, surface):
-        current_time = pygame.time.get_ticks()
+        """Return list rect notifikasi yang digambar"""
+        current_time = get_ticks()
         y_offset = 150
+        rects = []
         
         for notif in self.pending_notifications[:]:
             elapsed = current_time - notif['time']
@@ -386,24 +538,23 @@ class AchievementManager:
             box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
             pygame.draw.rect(box_surface, (0, 0, 0, 200), (0, 0, box_width, box_height), border_radius=10)
             pygame.draw.rect(box_surface, (255, 215, 0), (0, 0, box_width, box_height), 3, border_radius=10)
-            surface.blit(box_surface, (box_x, box_y))
+            rect = surface.blit(box_surface, (box_x, box_y))
             
             # Icon
-            font_icon = pygame.font.Font(None, 40)
-            icon_text = font_icon.render(notif['icon'], True, (255, 255, 255))
+            icon_text = assets.render_text(notif['icon'], 40, (255, 255, 255))
             surface.blit(icon_text, (box_x + 15, box_y + 15))
             
             # Title
-            font_title = pygame.font.Font(None, 28)
-            title_text = font_title.render("Achievement Unlocked!", True, (255, 215, 0))
+            title_text = assets.render_text("Achievement Unlocked!", 28, (255, 215, 0))
             surface.blit(title_text, (box_x + 55, box_y + 10))
             
             # Name
-            font_name = pygame.font.Font(None, 24)
-            name_text = font_name.render(notif['name'], True, (255, 255, 255))
-            surface.blit(name_text, (box_x + 55, box_y + 35))
+            name_text = assets.render_text(notif['name'], 24, (255, 255, 255))
+            rect.union_ip(surface.blit(name_text, (box_x + 55, box_y + 35)))
+            rects.append(rect)
             
             y_offset += 80
+        return rects
 
 
 class SaveData:
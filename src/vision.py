@@ -0,0 +1,682 @@
+import math
+import struct
+import threading
+import time
+import traceback
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+from .config import (SCREEN_WIDTH, SCREEN_HEIGHT, FACE_DETECTION_SKIP_FRAMES, MOUTH_OPEN_THRESHOLD,
+                     TRACKING_X_MIN, TRACKING_X_MAX, TRACKING_Y_MIN, TRACKING_Y_MAX,
+                     CV_WORKER_MODE, CV_SHARED_RING_SLOTS, FACE_DETECTION_FRAME_BUDGET_MS,
+                     FACE_DETECTION_MIN_SKIP, FACE_DETECTION_MAX_SKIP, FACE_MOTION_FAST, FACE_MOTION_STILL,
+                     FACE_ROI_ENABLED, FACE_ROI_MARGIN, FACE_ROI_SIZE, FILTER_MIN_CUTOFF, FILTER_BETA,
+                     FILTER_D_CUTOFF, MOUTH_FILTER_MIN_CUTOFF, MOUTH_FILTER_BETA, PREDICTION_MAX_LEAD_MS,
+                     SHOW_CAMERA_PREVIEW, PREVIEW_SIZE, PREVIEW_FPS)
+
+# Hasil tracking yang dipublish worker ke game loop
+# timestamp = waktu capture frame (time.perf_counter), mouth_ratio = jarak bibir ternormalisasi
+TrackingResult = namedtuple('TrackingResult', ['player_x', 'player_y', 'is_eating', 'timestamp', 'mouth_ratio'],
+                            defaults=[0.0])
+
+
+class LatestValue:
+    """Slot 'nilai terbaru' untuk satu writer dan banyak reader.
+
+    Writer menimpa slot, reader tidak pernah menunggu. Versi dan nilai disimpan
+    dalam satu tuple supaya pembacaan selalu konsisten tanpa lock.
+    """
+    def __init__(self, value=None):
+        self._slot = (0, value)
+        self._write_lock = threading.Lock()
+
+    def publish(self, value):
+        with self._write_lock:
+            self._slot = (self._slot[0] + 1, value)
+
+    def get(self):
+        """Return (version, value). Versi naik setiap kali ada publish baru."""
+        return self._slot
+
+
+class FaceTracker:
+    """Bungkus MediaPipe FaceMesh + logika mapping wajah ke posisi layar.
+
+    Dengan ROI aktif, setelah wajah ketemu inference hanya dijalankan pada crop
+    (yang juga di-downsize) di sekitar landmark terakhir. Full-frame search
+    hanya dipakai lagi saat tracking hilang.
+
+    Crop ROI berubah ukuran dan offset tiap frame, jadi tracking internal
+    FaceMesh (yang mengira input-nya frame kamera yang sama) akan jitter atau
+    re-detect. Dengan ROI aktif FaceMesh jalan di static_image_mode: setiap
+    crop diproses independen, tracking antar frame dilakukan oleh ROI sendiri.
+    """
+    def __init__(self, roi_enabled=FACE_ROI_ENABLED):
+        import mediapipe as mp
+        self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=roi_enabled,
+            max_num_faces=1,
+            refine_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        self.roi_enabled = roi_enabled
+        self.roi = None  # (x0, y0, x1, y1) dalam pixel frame, None = full-frame search
+
+    def process(self, image_bgr, timestamp=None):
+        """Jalankan inference pada frame BGR (sudah di-flip). Return TrackingResult atau None."""
+        points = None
+        if self.roi is not None:
+            points = self._process_roi(image_bgr)
+            if points is None:
+                self.roi = None  # Tracking hilang, cari lagi di full frame
+        if points is None:
+            points = self._infer(image_bgr)
+            if points is None:
+                return None
+
+        if self.roi_enabled:
+            self.roi = face_roi(points, image_bgr.shape[1], image_bgr.shape[0])
+        return landmarks_to_result(points, time.perf_counter() if timestamp is None else timestamp)
+
+    def _infer(self, image_bgr):
+        """Inference mentah, return array (N, 2) landmark ternormalisasi ke image_bgr atau None"""
+        image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+        results = self.face_mesh.process(image_rgb)
+        if not results.multi_face_landmarks:
+            return None
+        return np.array([(lm.x, lm.y) for lm in results.multi_face_landmarks[0].landmark], dtype=np.float32)
+
+    def _process_roi(self, image_bgr):
+        x0, y0, x1, y1 = self.roi
+        crop = image_bgr[y0:y1, x0:x1]
+        crop_w, crop_h = x1 - x0, y1 - y0
+        scale = FACE_ROI_SIZE / max(crop_w, crop_h)
+        if scale < 1.0:
+            crop = cv2.resize(crop, (max(1, int(crop_w * scale)), max(1, int(crop_h * scale))),
+                              interpolation=cv2.INTER_AREA)
+
+        points = self._infer(crop)
+        if points is None:
+            return None
+
+        # Koordinat crop -> koordinat ternormalisasi full frame
+        frame_h, frame_w = image_bgr.shape[:2]
+        points[:, 0] = (x0 + points[:, 0] * crop_w) / frame_w
+        points[:, 1] = (y0 + points[:, 1] * crop_h) / frame_h
+        return points
+
+    def close(self):
+        self.face_mesh.close()
+
+
+class SyntheticTracker:
+    """Pengganti FaceTracker untuk source yang sudah menyediakan landmark (tanpa MediaPipe)"""
+    def __init__(self, source):
+        self.source = source
+
+    def process(self, image_bgr, timestamp=None):
+        if self.source.points is None:
+            return None
+        return landmarks_to_result(self.source.points, time.perf_counter() if timestamp is None else timestamp)
+
+    def close(self):
+        pass
+
+
+def create_tracker(source):
+    """Tracker sesuai input source: landmark sintetis langsung dipakai, selain itu MediaPipe"""
+    if getattr(source, 'provides_landmarks', False):
+        return SyntheticTracker(source)
+    return FaceTracker()
+
+
+def face_roi(points, frame_w, frame_h, margin=FACE_ROI_MARGIN):
+    """Bounding box landmark + margin (persegi, di-clamp ke frame) dalam pixel"""
+    min_x, min_y = points.min(axis=0)
+    max_x, max_y = points.max(axis=0)
+    cx, cy = (min_x + max_x) / 2 * frame_w, (min_y + max_y) / 2 * frame_h
+    half = max((max_x - min_x) * frame_w, (max_y - min_y) * frame_h) * (0.5 + margin)
+
+    x0, y0 = max(0, int(cx - half)), max(0, int(cy - half))
+    x1, y1 = min(frame_w, int(cx + half)), min(frame_h, int(cy + half))
+    if x1 - x0 < 16 or y1 - y0 < 16:
+        return None
+    return x0, y0, x1, y1
+
+
+def landmarks_to_result(points, timestamp):
+    """Mapping landmark (array (N, 2) ternormalisasi ke frame) ke posisi layar + status mulut"""
+    nose_x, nose_y = points[1]
+
+    percent_x = (nose_x - TRACKING_X_MIN) / (TRACKING_X_MAX - TRACKING_X_MIN)
+    percent_y = (nose_y - TRACKING_Y_MIN) / (TRACKING_Y_MAX - TRACKING_Y_MIN)
+
+    percent_x = max(0.0, min(1.0, float(percent_x)))
+    percent_y = max(0.0, min(1.0, float(percent_y)))
+
+    lip_distance = abs(float(points[13][1] - points[14][1]))
+
+    return TrackingResult(int(percent_x * SCREEN_WIDTH), int(percent_y * SCREEN_HEIGHT),
+                          lip_distance > MOUTH_OPEN_THRESHOLD, timestamp, lip_distance)
+
+
+class OneEuroFilter:
+    """One-Euro filter (Casiez et al.): low-pass dengan cutoff adaptif terhadap kecepatan.
+
+    Selain nilai halus, filter juga menyimpan estimasi turunan (dx) yang dipakai
+    untuk ekstrapolasi ke waktu render.
+    """
+    def __init__(self, min_cutoff=FILTER_MIN_CUTOFF, beta=FILTER_BETA, d_cutoff=FILTER_D_CUTOFF):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.value = None
+        self.dx = 0.0
+        self.last_time = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, value, timestamp):
+        if self.value is None:
+            self.value, self.last_time = float(value), timestamp
+            return self.value
+
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            return self.value
+
+        raw_dx = (value - self.value) / dt
+        self.dx += self._alpha(self.d_cutoff, dt) * (raw_dx - self.dx)
+        cutoff = self.min_cutoff + self.beta * abs(self.dx)
+        self.value += self._alpha(cutoff, dt) * (value - self.value)
+        self.last_time = timestamp
+        return self.value
+
+    def predict(self, timestamp, max_lead):
+        """Ekstrapolasi kecepatan-konstan ke `timestamp` (maks max_lead detik ke depan)"""
+        if self.value is None:
+            return None
+        lead = max(0.0, min(max_lead, timestamp - self.last_time))
+        return self.value + self.dx * lead
+
+
+class LandmarkPredictor:
+    """Haluskan posisi hidung + rasio mulut lalu prediksi ke waktu render.
+
+    Dengan ini inference boleh jarang (cadence besar) tanpa kontrol terasa
+    patah-patah mengikuti rate deteksi.
+    """
+    def __init__(self, max_lead_ms=PREDICTION_MAX_LEAD_MS):
+        self.x_filter = OneEuroFilter()
+        self.y_filter = OneEuroFilter()
+        self.mouth_filter = OneEuroFilter(MOUTH_FILTER_MIN_CUTOFF, MOUTH_FILTER_BETA)
+        self.max_lead = max_lead_ms / 1000.0
+        self._last_timestamp = None
+
+    def update(self, result):
+        """Masukkan hasil tracking; hasil yang sama (timestamp sama) diabaikan"""
+        if result.timestamp == self._last_timestamp:
+            return
+        self._last_timestamp = result.timestamp
+        self.x_filter(result.player_x, result.timestamp)
+        self.y_filter(result.player_y, result.timestamp)
+        self.mouth_filter(result.mouth_ratio, result.timestamp)
+
+    def predict(self, timestamp):
+        """Return (player_x, player_y, is_eating) untuk waktu render `timestamp`"""
+        if self._last_timestamp is None:
+            return SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, False
+        x = self.x_filter.predict(timestamp, self.max_lead)
+        y = self.y_filter.predict(timestamp, self.max_lead)
+        mouth = self.mouth_filter.predict(timestamp, self.max_lead)
+        x = int(max(0, min(SCREEN_WIDTH, x)))
+        y = int(max(0, min(SCREEN_HEIGHT, y)))
+        return x, y, mouth > MOUTH_OPEN_THRESHOLD
+
+
+class DetectionScheduler:
+    """Atur cadence deteksi wajah (deteksi tiap `skip` frame) secara adaptif.
+
+    - Batas bawah: biaya rata-rata per frame (frame_ms + inference_ms / skip)
+      harus muat di budget_ms.
+    - Di atas batas itu, kepala yang bergerak cepat (atau wajah hilang) membuat
+      deteksi lebih sering, kepala diam membuat cadence mundur ke max_skip.
+    """
+    EMA_ALPHA = 0.2
+
+    def __init__(self, budget_ms=FACE_DETECTION_FRAME_BUDGET_MS, min_skip=FACE_DETECTION_MIN_SKIP,
+                 max_skip=FACE_DETECTION_MAX_SKIP, initial_skip=FACE_DETECTION_SKIP_FRAMES):
+        self.budget_ms = budget_ms
+        self.min_skip = min_skip
+        self.max_skip = max_skip
+        self.skip = max(min_skip, min(max_skip, initial_skip))
+        self.frame_ms = 0.0
+        self.inference_ms = 0.0
+        self.motion = 0.0  # px/detik, EMA
+        self.face_found = False
+        self._frames_since_detection = 0
+        self._last_result = None
+
+    def _ema(self, current, sample):
+        return sample if current == 0.0 else current + (sample - current) * self.EMA_ALPHA
+
+    def should_detect(self):
+        self._frames_since_detection += 1
+        if self._frames_since_detection >= self.skip:
+            self._frames_since_detection = 0
+            return True
+        return False
+
+    def record_frame(self, frame_ms):
+        """Biaya non-inference per frame (flip + publish, tanpa waktu menunggu source)"""
+        self.frame_ms = self._ema(self.frame_ms, frame_ms)
+
+    def record_inference(self, inference_ms, result):
+        self.inference_ms = self._ema(self.inference_ms, inference_ms)
+        self.face_found = result is not None
+        if result is not None:
+            last = self._last_result
+            if last is not None and result.timestamp > last.timestamp:
+                speed = math.hypot(result.player_x - last.player_x, result.player_y - last.player_y) \
+                        / (result.timestamp - last.timestamp)
+                self.motion = self._ema(self.motion, speed)
+            self._last_result = result
+        self._retune()
+
+    def _retune(self):
+        available_ms = max(self.budget_ms - self.frame_ms, 1.0)
+        budget_skip = min(self.max_skip, max(self.min_skip, math.ceil(self.inference_ms / available_ms)))
+
+        if not self.face_found or self.motion >= FACE_MOTION_FAST:
+            motion_skip = self.min_skip
+        elif self.motion <= FACE_MOTION_STILL:
+            motion_skip = self.max_skip
+        else:
+            stillness = (FACE_MOTION_FAST - self.motion) / (FACE_MOTION_FAST - FACE_MOTION_STILL)
+            motion_skip = round(self.min_skip + stillness * (self.max_skip - self.min_skip))
+
+        self.skip = max(budget_skip, motion_skip)
+
+
+class CaptureWorker(threading.Thread):
+    """Thread terpisah untuk cap.read() + face_mesh.process().
+
+    Game loop cukup membaca latest_result() / latest_preview() tanpa pernah
+    blocking pada kamera atau inference.
+    """
+    def __init__(self, cap, tracker=None):
+        super().__init__(name='CaptureWorker', daemon=True)
+        self.cap = cap
+        self.tracker = tracker
+        self.scheduler = DetectionScheduler()
+        self.result = LatestValue(TrackingResult(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, False, time.perf_counter()))
+        self.preview = LatestValue(None)
+        self.error = None  # Exception yang menghentikan worker (source / tracker gagal)
+        self._stop_event = threading.Event()
+
+    @property
+    def failed(self):
+        """True kalau worker berhenti karena error (input game membeku di hasil terakhir)"""
+        return self.error is not None
+
+    def run(self):
+        try:
+            while not self._stop_event.is_set():
+                success, image = self.cap.read()
+                if not success:
+                    time.sleep(0.005)
+                    continue
+
+                # Waktu menunggu frame berikutnya dari source bukan biaya frame, timer mulai setelah read()
+                capture_time = time.perf_counter()
+                image = cv2.flip(image, 1)
+                self.preview.publish(image)
+                self.scheduler.record_frame((time.perf_counter() - capture_time) * 1000)
+                self._handle_frame(image, capture_time)
+        except Exception as e:
+            print(f"⚠ Capture worker berhenti: {e!r}")
+            traceback.print_exc()
+            self.error = e
+        finally:
+            try:
+                self._shutdown()
+            except Exception as e:
+                print(f"⚠ Gagal menutup tracker: {e!r}")
+
+    def _handle_frame(self, image, capture_time):
+        if self.scheduler.should_detect():
+            if self.tracker is None:
+                self.tracker = create_tracker(self.cap)
+            inference_start = time.perf_counter()
+            result = self.tracker.process(image, capture_time)
+            self.scheduler.record_inference((time.perf_counter() - inference_start) * 1000, result)
+            if result is not None:
+                self.result.publish(result)
+
+    def _shutdown(self):
+        if self.tracker is not None:
+            self.tracker.close()
+
+    def latest_result(self):
+        return self.result.get()[1]
+
+    def detection_stats(self):
+        """Return (cadence, rata-rata inference ms) untuk ditampilkan di HUD"""
+        return self.scheduler.skip, self.scheduler.inference_ms
+
+    def latest_preview(self):
+        """Return (version, frame BGR) terbaru; frame None sebelum kamera siap."""
+        return self.preview.get()
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
+class CameraPreview:
+    """Thumbnail facecam dengan buffer yang dialokasikan sekali.
+
+    Frame di-downsize + dikonversi di OpenCV langsung ke buffer RGB yang
+    di-share oleh satu pygame Surface persisten (pygame.image.frombuffer),
+    jadi tidak ada alokasi per frame. Refresh dibatasi PREVIEW_FPS dan tidak
+    ada kerja sama sekali saat preview disembunyikan.
+    """
+    def __init__(self, size=PREVIEW_SIZE, fps=PREVIEW_FPS, visible=SHOW_CAMERA_PREVIEW):
+        import pygame
+        self.size = size
+        self.visible = visible
+        self.interval = 1.0 / fps
+        width, height = size
+        self._bgr = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self.surface = pygame.image.frombuffer(self._rgb, size, 'RGB')
+        self.ready = False
+        self._version = 0
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def update(self, version, frame, now):
+        if not self.visible or frame is None or version == self._version:
+            return
+        if now - self._last_refresh < self.interval:
+            return
+        self._version = version
+        self._last_refresh = now
+        self.convert(frame)
+
+    def convert(self, frame):
+        """Downsize + konversi warna frame BGR ke buffer surface (tanpa alokasi)"""
+        cv2.resize(frame, self.size, dst=self._bgr, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        self.ready = True
+
+
+# ==================================
+# MODE PROCESS (SHARED MEMORY)
+# ==================================
+# Layout satu segmen shared memory:
+#   [0:64)    header  -> word int64: latest frame (seq * RING_SEQ_STRIDE + slot), slot yang sedang dibaca, stop,
+#                        cadence, inference (mikrodetik)
+#   [64:128)  result  -> seqlock counter + TrackingResult dalam layout tetap
+#   [128:...) frame slots: 64 byte header slot (float64 waktu capture) + height * width * 3 byte (BGR)
+RING_RESULT = struct.Struct('<qiiBdd')
+RING_HEADER_OFFSET = 0
+RING_RESULT_OFFSET = 64
+RING_FRAMES_OFFSET = 128
+RING_SLOT_HEADER = 64
+RING_SEQ_STRIDE = 16
+RING_READ_RETRIES = 100  # Batas retry seqlock (writer mati di tengah tulis -> seq ganjil selamanya)
+_WORD = struct.Struct('<q')
+_STAMP = struct.Struct('<d')
+
+
+class SharedFrameRing:
+    """Ring buffer frame di multiprocessing.shared_memory (tanpa pickling).
+
+    Producer (capture thread) menulis ke slot yang tidak sedang dibaca consumer,
+    consumer (proses inference) selalu mengambil frame terbaru.
+    """
+    def __init__(self, shm, shape, slots, owner):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.owner = owner
+        self.frame_size = int(np.prod(self.shape))
+        self.slot_stride = ring_slot_stride(self.frame_size)
+        self.frames = [
+            np.ndarray(self.shape, dtype=np.uint8, buffer=shm.buf,
+                       offset=RING_FRAMES_OFFSET + i * self.slot_stride + RING_SLOT_HEADER)
+            for i in range(slots)
+        ]
+        self._write_seq = 0
+
+    @classmethod
+    def create(cls, shape, slots=CV_SHARED_RING_SLOTS):
+        from multiprocessing import shared_memory
+        stride = ring_slot_stride(int(np.prod(shape)))
+        shm = shared_memory.SharedMemory(create=True, size=RING_FRAMES_OFFSET + slots * stride)
+        shm.buf[:RING_FRAMES_OFFSET] = bytes(RING_FRAMES_OFFSET)
+        ring = cls(shm, shape, slots, owner=True)
+        ring._set_word(1, -1)
+        return ring
+
+    @classmethod
+    def attach(cls, name, shape, slots):
+        from multiprocessing import shared_memory
+        # Tidak perlu unregister dari resource tracker: dengan spawn, anak memakai tracker yang
+        # sama dengan proses utama, dan segmen tetap dibersihkan tracker kalau proses utama crash
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, shape, slots, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def _get_word(self, index):
+        return _WORD.unpack_from(self.shm.buf, RING_HEADER_OFFSET + index * 8)[0]
+
+    def _set_word(self, index, value):
+        _WORD.pack_into(self.shm.buf, RING_HEADER_OFFSET + index * 8, value)
+
+    # --- Producer side ---
+    def write_frame(self, image, capture_time):
+        latest = self._get_word(0)
+        latest_slot = latest % RING_SEQ_STRIDE if self._write_seq else -1
+        reading_slot = self._get_word(1)
+        slot = next(i for i in range(self.slots) if i != latest_slot and i != reading_slot)
+        np.copyto(self.frames[slot], image)
+        _STAMP.pack_into(self.shm.buf, RING_FRAMES_OFFSET + slot * self.slot_stride, capture_time)
+        self._write_seq += 1
+        self._set_word(0, self._write_seq * RING_SEQ_STRIDE + slot)
+
+    def read_result(self):
+        """Baca result dengan protokol seqlock. Return (seq, TrackingResult) atau (0, None).
+
+        Kalau tidak dapat pembacaan konsisten dalam RING_READ_RETRIES percobaan (writer
+        sedang menulis / mati di tengah tulis) return (0, None), caller memakai result lama.
+        """
+        for _ in range(RING_READ_RETRIES):
+            seq1, x, y, eating, timestamp, mouth_ratio = RING_RESULT.unpack_from(self.shm.buf, RING_RESULT_OFFSET)
+            if seq1 == 0:
+                return 0, None
+            if seq1 % 2:
+                continue
+            seq2 = _WORD.unpack_from(self.shm.buf, RING_RESULT_OFFSET)[0]
+            if seq1 == seq2:
+                return seq1, TrackingResult(x, y, bool(eating), timestamp, mouth_ratio)
+        return 0, None
+
+    def request_stop(self):
+        self._set_word(2, 1)
+
+    # --- Consumer side ---
+    def acquire_latest(self, last_seq):
+        """Kunci slot frame terbaru jika seq-nya lebih baru dari last_seq.
+
+        Return (seq, frame, waktu capture) atau (last_seq, None, None).
+        """
+        latest = self._get_word(0)
+        seq, slot = divmod(latest, RING_SEQ_STRIDE)
+        if seq <= last_seq:
+            return last_seq, None, None
+        self._set_word(1, slot)
+        # Producer bisa saja memilih slot ini tepat sebelum kita menguncinya, cek ulang
+        if self._get_word(0) != latest:
+            self._set_word(1, -1)
+            return last_seq, None, None
+        capture_time = _STAMP.unpack_from(self.shm.buf, RING_FRAMES_OFFSET + slot * self.slot_stride)[0]
+        return seq, self.frames[slot], capture_time
+
+    def release(self):
+        self._set_word(1, -1)
+
+    def write_result(self, result):
+        seq = _WORD.unpack_from(self.shm.buf, RING_RESULT_OFFSET)[0]
+        _WORD.pack_into(self.shm.buf, RING_RESULT_OFFSET, seq + 1)
+        RING_RESULT.pack_into(self.shm.buf, RING_RESULT_OFFSET, seq + 1, int(result.player_x),
+                              int(result.player_y), int(result.is_eating), result.timestamp,
+                              result.mouth_ratio)
+        _WORD.pack_into(self.shm.buf, RING_RESULT_OFFSET, seq + 2)
+
+    def write_stats(self, cadence, inference_ms):
+        self._set_word(3, cadence)
+        self._set_word(4, int(inference_ms * 1000))
+
+    def read_stats(self):
+        return self._get_word(3), self._get_word(4) / 1000.0
+
+    @property
+    def stop_requested(self):
+        return self._get_word(2) == 1
+
+    def close(self):
+        self.frames = []
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def ring_slot_stride(frame_size):
+    """Ukuran satu slot (header + frame), dibulatkan ke kelipatan 64 byte"""
+    return (RING_SLOT_HEADER + frame_size + 63) // 64 * 64
+
+
+def _inference_process_main(ring_name, shape, slots):
+    """Entry point proses inference (harus level modul supaya bisa di-spawn)."""
+    ring = SharedFrameRing.attach(ring_name, shape, slots)
+    tracker = FaceTracker()
+    # Biaya capture ada di proses utama, di sini budget hanya dipakai inference
+    scheduler = DetectionScheduler()
+    last_seq = 0
+    try:
+        while not ring.stop_requested:
+            seq, frame, capture_time = ring.acquire_latest(last_seq + scheduler.skip - 1)
+            if frame is None:
+                time.sleep(0.001)
+                continue
+            inference_start = time.perf_counter()
+            try:
+                result = tracker.process(frame, capture_time)
+            finally:
+                ring.release()
+            scheduler.record_inference((time.perf_counter() - inference_start) * 1000, result)
+            ring.write_stats(scheduler.skip, scheduler.inference_ms)
+            last_seq = seq
+            if result is not None:
+                ring.write_result(result)
+    finally:
+        tracker.close()
+        ring.close()
+
+
+class ProcessCaptureWorker(CaptureWorker):
+    """Capture tetap di thread, tapi FaceMesh jalan di proses lain (bebas dari GIL game loop).
+
+    Kalau proses gagal start atau mati di tengah jalan, worker otomatis pindah
+    ke inference in-process seperti CaptureWorker biasa.
+    """
+    def __init__(self, cap, slots=CV_SHARED_RING_SLOTS):
+        super().__init__(cap)
+        self.slots = slots
+        self.ring = None
+        self.process = None
+        self.fallback = False
+        self._result_seq = 0
+        self._process_stats = (self.scheduler.skip, 0.0)
+
+    def _start_process(self, shape):
+        import multiprocessing
+        try:
+            self.ring = SharedFrameRing.create(shape, self.slots)
+            ctx = multiprocessing.get_context('spawn')
+            self.process = ctx.Process(target=_inference_process_main, name='FaceMeshProcess',
+                                       args=(self.ring.name, shape, self.slots),
+                                       daemon=True)
+            self.process.start()
+        except Exception as e:
+            print(f"⚠ Inference process gagal start ({e}), fallback ke mode thread")
+            self._close_ring()
+            self.fallback = True
+
+    def _handle_frame(self, image, capture_time):
+        if self.fallback:
+            return super()._handle_frame(image, capture_time)
+
+        if self.ring is None:
+            self._start_process(image.shape)
+            if self.fallback:
+                return super()._handle_frame(image, capture_time)
+
+        if not self.process.is_alive():
+            print("⚠ Inference process berhenti, fallback ke mode thread")
+            self._close_ring()
+            self.fallback = True
+            return super()._handle_frame(image, capture_time)
+
+        self.ring.write_frame(image, capture_time)
+        cadence, inference_ms = self.ring.read_stats()
+        if cadence:
+            self._process_stats = (cadence, inference_ms)
+        seq, result = self.ring.read_result()
+        if seq != self._result_seq and result is not None:
+            self._result_seq = seq
+            self.result.publish(result)
+
+    def detection_stats(self):
+        if self.fallback:
+            return super().detection_stats()
+        return self._process_stats
+
+    def _close_ring(self):
+        if self.ring is not None:
+            self.ring.request_stop()
+            if self.process is not None:
+                self.process.join(1.0)
+                if self.process.is_alive():
+                    self.process.terminate()
+            self.ring.close()
+            self.ring = None
+
+    def _shutdown(self):
+        self._close_ring()
+        super()._shutdown()
+
+
+def create_capture_worker(cap, mode=CV_WORKER_MODE):
+    """Factory worker sesuai CV_WORKER_MODE di config"""
+    if mode == 'process' and not getattr(cap, 'provides_landmarks', False):
+        try:
+            from multiprocessing import shared_memory  # noqa: F401 (cek ketersediaan)
+            return ProcessCaptureWorker(cap)
+        except ImportError:
+            print("⚠ multiprocessing.shared_memory tidak tersedia, fallback ke mode thread")
+    return CaptureWorker(cap)
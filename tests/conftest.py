@@ -0,0 +1,21 @@
+import pytest
+
+
+class FakeClock:
+    """Pengganti modul `time` (perf_counter + sleep) supaya test timing deterministik.
+
+    sleep() tidak menunggu, hanya memajukan waktu palsu.
+    """
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
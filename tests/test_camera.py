@@ -0,0 +1,106 @@
+import cv2
+import numpy as np
+import pytest
+
+from src import camera
+
+
+class PacedCapture:
+    """cv2.VideoCapture palsu: frame baru tiap 1/fps detik, buffer `buffer_size` frame.
+
+    grab() mengambil frame tertua di buffer tanpa menunggu, atau blocking
+    sampai frame berikutnya jadi kalau buffer kosong. retrieve() mengembalikan
+    frame yang isinya nomor frame tersebut. Waktu dari `clock` (FakeClock),
+    jadi menunggu frame hanya memajukan waktu palsu.
+    """
+    def __init__(self, clock, fps=30, buffer_size=1, accept_buffer_size=False):
+        self.clock = clock
+        self.fps = fps
+        self.buffer_size = buffer_size
+        self.accept_buffer_size = accept_buffer_size
+        self.start = clock.perf_counter()
+        self.consumed = -1
+        self.current = None
+
+    def produced_at(self, index):
+        return self.start + (index + 1) / self.fps
+
+    def _latest_index(self):
+        # Epsilon: tepat di waktu produksi frame dihitung sudah jadi (hindari error pembulatan float)
+        return int((self.clock.perf_counter() - self.start) * self.fps + 1e-6) - 1
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_BUFFERSIZE:
+            if not self.accept_buffer_size:
+                return False
+            self.buffer_size = int(value)
+        return True
+
+    def get(self, prop):
+        return {cv2.CAP_PROP_FRAME_WIDTH: 64, cv2.CAP_PROP_FRAME_HEIGHT: 48, cv2.CAP_PROP_FPS: self.fps,
+                cv2.CAP_PROP_BUFFERSIZE: self.buffer_size}.get(prop, 0)
+
+    def grab(self):
+        latest = self._latest_index()
+        oldest_buffered = max(self.consumed + 1, latest - self.buffer_size + 1)
+        if oldest_buffered > latest:
+            # Buffer kosong: tunggu frame berikutnya
+            self.clock.sleep(self.produced_at(oldest_buffered) - self.clock.perf_counter())
+        self.consumed = self.current = oldest_buffered
+        return True
+
+    def retrieve(self):
+        return True, np.full((48, 64, 3), self.current % 256, dtype=np.uint8)
+
+    def read(self):
+        self.grab()
+        return self.retrieve()
+
+    def release(self):
+        pass
+
+
+def run_reader(monkeypatch, clock, work_ms, duration=1.5, **kwargs):
+    """Loop read() + kerja `work_ms` selama `duration` detik waktu palsu.
+
+    Return (cap, read per detik, staleness maksimum selain read pertama).
+    """
+    monkeypatch.setattr(camera, 'time', clock)
+    fake = PacedCapture(clock, **kwargs)
+    monkeypatch.setattr(camera.cv2, 'VideoCapture', lambda index: fake)
+    cap = camera.CameraCapture(fps=30)
+    reads, staleness = 0, []
+    end = clock.perf_counter() + duration
+    while clock.perf_counter() < end:
+        ok, _ = cap.read()
+        assert ok
+        reads += 1
+        staleness.append(clock.perf_counter() - fake.produced_at(fake.current))
+        clock.sleep(work_ms / 1000.0)
+    return cap, reads / duration, max(staleness[1:])
+
+
+@pytest.mark.parametrize('work_ms', [20, 26])
+def test_drain_keeps_up_with_camera(monkeypatch, fake_clock, work_ms):
+    cap, rate, stale = run_reader(monkeypatch, fake_clock, work_ms, buffer_size=1)
+    assert cap.drain
+    # Kerja < 1 interval frame: semua frame terbaca, tidak ada frame yang dibuang lalu ditunggu lagi
+    assert rate >= 29
+    assert stale < 1.0 / 30
+
+
+def test_drain_returns_newest_buffered_frame(monkeypatch, fake_clock):
+    # Buffer 4, kerja 2.5 frame: frame antre harus dibuang, tapi jangan sampai menunggu frame setelahnya
+    cap, rate, stale = run_reader(monkeypatch, fake_clock, 85, buffer_size=4)
+    assert rate >= 11
+    assert stale < 2.0 / 30
+
+
+def test_no_drain_when_buffer_size_accepted(monkeypatch, fake_clock):
+    cap, rate, stale = run_reader(monkeypatch, fake_clock, 26, buffer_size=4, accept_buffer_size=True)
+    assert not cap.drain
+    assert rate >= 29
+    assert stale < 1.0 / 30
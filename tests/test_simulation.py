@@ -0,0 +1,42 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+import src.simulation
+from src.assets import assets
+from src.clock import SimClock, use_clock
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_TICK_RATE
+
+
+@pytest.fixture(scope='module')
+def game_assets():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    assets.load_assets()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def game_clock():
+    clock = SimClock()
+    use_clock(clock)
+    yield clock
+    use_clock(None)
+
+
+def test_swarm_tracks_spawned_bots(game_assets, game_clock, monkeypatch):
+    monkeypatch.setattr(src.simulation, 'SWARM_ENGINE', True)
+    sim = src.simulation.GameSimulation(persistent=False)
+    assert sim.swarm is not None
+
+    for _ in range(SIM_TICK_RATE * 10):
+        game_clock.advance(1000 / SIM_TICK_RATE)
+        # Player diam di pojok, mulut tertutup: bot hanya spawn + despawn
+        sim.step(0, 0, False)
+        assert len(sim.swarm) == len(sim.bot_fish_group)
+    assert len(sim.bot_fish_group) > 0
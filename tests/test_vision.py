@@ -0,0 +1,126 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from src import vision
+from src.vision import (CaptureWorker, DetectionScheduler, TrackingResult, SharedFrameRing,
+                        RING_RESULT_OFFSET, _WORD)
+
+
+class PacedSource:
+    """Source palsu yang read()-nya blocking sampai frame berikutnya (seperti kamera sungguhan).
+
+    Berhenti (stop worker) setelah `frames` frame.
+    """
+    def __init__(self, clock, fps=30, frames=90):
+        self.clock = clock
+        self.interval = 1.0 / fps
+        self.next_frame = clock.perf_counter()
+        self.frames = frames
+        self.worker = None
+        self.frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    def read(self):
+        self.frames -= 1
+        if self.frames <= 0:
+            self.worker._stop_event.set()
+        self.next_frame += self.interval
+        self.clock.sleep(self.next_frame - self.clock.perf_counter())
+        return True, self.frame
+
+    def release(self):
+        pass
+
+
+class MovingTracker:
+    """Tracker palsu: inference `cost_ms`, wajah bergerak horizontal `speed` px/detik"""
+    def __init__(self, clock, speed, cost_ms=8):
+        self.clock = clock
+        self.speed = speed
+        self.cost = cost_ms / 1000.0
+
+    def process(self, image_bgr, timestamp):
+        self.clock.sleep(self.cost)
+        return TrackingResult(int(100 + timestamp * self.speed), 300, False, timestamp)
+
+    def close(self):
+        pass
+
+
+class BrokenTracker(MovingTracker):
+    def process(self, image_bgr, timestamp):
+        raise RuntimeError("inference gagal")
+
+
+def run_worker(clock, tracker, monkeypatch):
+    """Jalankan CaptureWorker.run() sinkron di atas waktu palsu"""
+    monkeypatch.setattr(vision, 'time', clock)
+    source = PacedSource(clock)
+    worker = source.worker = CaptureWorker(source, tracker=tracker)
+    worker.run()
+    return worker
+
+
+def test_frame_ms_excludes_source_wait(fake_clock, monkeypatch):
+    worker = run_worker(fake_clock, MovingTracker(fake_clock, speed=0), monkeypatch)
+    # Menunggu frame 30 FPS (~33 ms) tidak boleh masuk ke biaya frame (flip + publish = 0 di waktu palsu)
+    assert worker.scheduler.frame_ms < 1.0
+    assert worker.scheduler.skip == 6
+
+
+def run_scheduler(speed, frame_ms=1.0, inference_ms=8.0, fps=30, frames=120):
+    """DetectionScheduler dengan timestamp sintetis: kepala bergerak `speed` px/detik"""
+    scheduler = DetectionScheduler()
+    for i in range(frames):
+        t = i / fps
+        scheduler.record_frame(frame_ms)
+        if scheduler.should_detect():
+            scheduler.record_inference(inference_ms, TrackingResult(int(100 + t * speed), 300, False, t))
+    return scheduler.skip
+
+
+def test_skip_goes_down_when_motion_goes_up():
+    still = run_scheduler(speed=0)
+    medium = run_scheduler(speed=450)
+    fast = run_scheduler(speed=2000)
+    assert still == 6
+    assert fast < medium < still
+    assert fast == 1
+
+
+def test_skip_respects_budget():
+    # Inference 40 ms tidak muat di budget 16.6 ms per frame walaupun kepala bergerak cepat
+    assert run_scheduler(speed=2000, inference_ms=40.0) >= 3
+
+
+def test_worker_error_is_exposed(fake_clock, monkeypatch):
+    worker = run_worker(fake_clock, BrokenTracker(fake_clock, speed=0), monkeypatch)
+    assert worker.failed
+    assert isinstance(worker.error, RuntimeError)
+
+
+def _attach_and_close(name, shape, slots):
+    ring = SharedFrameRing.attach(name, shape, slots)
+    ring.close()
+
+
+def test_shared_ring_spawn_attach_keeps_parent_ownership():
+    # Anak (spawn) attach + close, lalu proses utama unlink: tracker tidak boleh error
+    ring = SharedFrameRing.create((4, 4, 3), slots=3)
+    ctx = multiprocessing.get_context('spawn')
+    child = ctx.Process(target=_attach_and_close, args=(ring.name, (4, 4, 3), 3))
+    child.start()
+    child.join(20)
+    assert child.exitcode == 0
+    ring.close()
+
+
+def test_shared_ring_read_result_gives_up_on_torn_write():
+    ring = SharedFrameRing.create((4, 4, 3), slots=3)
+    try:
+        # Writer mati di tengah write_result: seq ganjil selamanya
+        _WORD.pack_into(ring.shm.buf, RING_RESULT_OFFSET, 3)
+        assert ring.read_result() == (0, None)
+    finally:
+        ring.close()